@@ -6,6 +6,7 @@ this module only owns sync-root + git-meta paths.
 
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
 
@@ -37,6 +38,48 @@ RDEV_SYNC_LOG = Path.home() / ".rdev" / "sync.log"
 DEFAULT_BASE_SYNC_DIRS = ["scripts", "sglang", "my-toolbox", "sgl-eval"]
 
 
+@functools.lru_cache(maxsize=None)
+def _yaml_safe_codec():
+    """``(yaml, Loader, Dumper)``, resolved once: libyaml's CSafeLoader /
+    CSafeDumper when PyYAML was built with it, else the pure-Python Safe* pair.
+    """
+    import yaml  # lazy: keeps config's import graph light for rgit et al.
+
+    return (
+        yaml,
+        getattr(yaml, "CSafeLoader", yaml.SafeLoader),
+        getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+    )
+
+
+def yaml_safe_load(stream):
+    """``yaml.safe_load``, parsed by libyaml when available; the pure-Python
+    SafeLoader is several times slower on startup.
+    """
+    yaml, loader, _ = _yaml_safe_codec()
+    return yaml.load(stream, Loader=loader)
+
+
+def yaml_safe_dump(data, stream=None, **kwargs):
+    """``yaml.safe_dump`` counterpart of yaml_safe_load. Returns the document
+    as a str when ``stream`` is None, else writes it there.
+    """
+    yaml, _, dumper = _yaml_safe_codec()
+    return yaml.dump(data, stream, Dumper=dumper, **kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def optional_orjson():
+    """The orjson module if installed, else None; callers fall back to the
+    stdlib json. orjson is not a declared dependency (remote hosts may lack it).
+    """
+    try:
+        import orjson  # lazy: optional, and only the JSON paths need it
+    except ImportError:
+        return None
+    return orjson
+
+
 def get_base_sync_dirs() -> list[str]:
     """Return the base sync repos (deduped, order preserved).
 
@@ -45,11 +88,9 @@ def get_base_sync_dirs() -> list[str]:
     missing config file or missing key falls back to the defaults, keeping the
     historical behavior on a machine without the ``sync`` section.
     """
-    import yaml  # lazy: keeps config's import graph light for rgit et al.
-
     try:
-        with open(RDEV_CONFIG) as f:
-            raw = yaml.safe_load(f) or {}
+        with open(RDEV_CONFIG, "rb") as f:
+            raw = yaml_safe_load(f) or {}
     except FileNotFoundError:
         raw = {}
     configured = (raw.get("sync") or {}).get("base_dirs")
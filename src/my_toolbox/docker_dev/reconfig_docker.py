@@ -27,8 +27,10 @@ def sudo_run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
 
 def step_stop_services():
     print(yellow_text("[1/5] Stopping docker and containerd..."))
-    sudo_run(["systemctl", "stop", "docker", "docker.socket"], check=False)
-    sudo_run(["systemctl", "stop", "containerd"], check=False)
+    # One sudo round trip for all units; systemctl stops them in dependency order.
+    sudo_run(
+        ["systemctl", "stop", "docker", "docker.socket", "containerd"], check=False
+    )
 
 
 def step_clean_data(opts: ReconfigOptions):
@@ -41,9 +43,8 @@ def step_clean_data(opts: ReconfigOptions):
     if do_clean:
         print(yellow_text("[2/5] Cleaning all old data..."))
         subdirs = ["containers", "overlay2", "image", "network", "buildkit", "tmp"]
-        for d in subdirs:
-            sudo_run(["rm", "-rf", f"{opts.data_root}/{d}"], check=False)
-        sudo_run(["rm", "-rf", "/var/lib/containerd"], check=False)
+        targets = [f"{opts.data_root}/{d}" for d in subdirs]
+        sudo_run(["rm", "-rf", *targets, "/var/lib/containerd"], check=False)
         print(green_text("   Old data cleaned."))
     else:
         print(yellow_text("[2/5] Skipping clean, keeping existing data."))
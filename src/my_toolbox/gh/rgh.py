@@ -8,6 +8,7 @@ Usage:
     rgh checkout <pr> --path P  # custom worktree path
 """
 
+import shlex
 import subprocess
 import sys
 from pathlib import Path
@@ -30,7 +31,7 @@ def _callback() -> None:
 
 def _run_or_print(cmd: list[str], execute: bool) -> None:
     """Print a gh command, optionally execute it."""
-    typer.echo(" ".join(cmd))
+    typer.echo(shlex.join(cmd))
     if execute:
         sys.exit(subprocess.call(cmd))
 
@@ -124,7 +125,7 @@ def checkout(
 
     repo_flag = ["--repo", repo_full] if repo_full else []
     cmd = ["gh", "pr", "checkout", pr_number, *repo_flag]
-    typer.echo(" ".join(cmd), err=True)
+    typer.echo(shlex.join(cmd), err=True)
     ret = subprocess.call(cmd, cwd=str(wt_path))
     if ret != 0:
         typer.echo("error: gh pr checkout failed, cleaning up worktree", err=True)
@@ -5,12 +5,15 @@ from dataclasses import dataclass
 from typing import Optional
 from urllib.parse import urlparse
 
-_ACTIONS_RUN_RE = re.compile(
-    r"^/(?P<owner>[^/]+)/(?P<repo>[^/]+)/actions/runs/(?P<run_id>\d+)"
-    r"(?:/job/(?P<job_id>\d+))?"
+# One pass over the path; which of run_id / pr / issue matched tells the type.
+# match() (not fullmatch) on purpose: trailing segments like /files or
+# /attempts/2 are accepted.
+_GH_PATH_RE = re.compile(
+    r"^/(?P<owner>[^/]+)/(?P<repo>[^/]+)/"
+    r"(?:actions/runs/(?P<run_id>\d+)(?:/job/(?P<job_id>\d+))?"
+    r"|pull/(?P<pr>\d+)"
+    r"|issues/(?P<issue>\d+))"
 )
-_PR_RE = re.compile(r"^/(?P<owner>[^/]+)/(?P<repo>[^/]+)/pull/(?P<number>\d+)")
-_ISSUE_RE = re.compile(r"^/(?P<owner>[^/]+)/(?P<repo>[^/]+)/issues/(?P<number>\d+)")
 
 
 @dataclass
@@ -28,35 +31,19 @@ class GitHubURL:
 
 def parse_github_url(url: str) -> Optional[GitHubURL]:
     """Parse a GitHub URL into structured components. Returns None if unrecognized."""
-    parsed = urlparse(url)
-    path = parsed.path
+    m = _GH_PATH_RE.match(urlparse(url).path)
+    if m is None:
+        return None
 
-    m = _ACTIONS_RUN_RE.match(path)
-    if m:
+    owner, repo = m.group("owner"), m.group("repo")
+    if m.group("run_id") is not None:
         return GitHubURL(
-            owner=m.group("owner"),
-            repo=m.group("repo"),
+            owner=owner,
+            repo=repo,
             type="run",
             number=m.group("run_id"),
             job_id=m.group("job_id"),
         )
-
-    m = _PR_RE.match(path)
-    if m:
-        return GitHubURL(
-            owner=m.group("owner"),
-            repo=m.group("repo"),
-            type="pr",
-            number=m.group("number"),
-        )
-
-    m = _ISSUE_RE.match(path)
-    if m:
-        return GitHubURL(
-            owner=m.group("owner"),
-            repo=m.group("repo"),
-            type="issue",
-            number=m.group("number"),
-        )
-
-    return None
+    if m.group("pr") is not None:
+        return GitHubURL(owner=owner, repo=repo, type="pr", number=m.group("pr"))
+    return GitHubURL(owner=owner, repo=repo, type="issue", number=m.group("issue"))
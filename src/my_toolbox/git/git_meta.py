@@ -6,10 +6,15 @@ the metadata directory (sync_root / commit_msg / <repo> / *.txt).
 
 from __future__ import annotations
 
-import json
+import os
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Iterator, Mapping, Optional
+
+from my_toolbox.config import optional_orjson
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
 
 WORKTREE_MAP_FILE = "worktrees.json"
 
@@ -21,103 +26,305 @@ _LOG_FORMAT = (
     "%C(auto)%d%C(reset)"
 )
 
-GIT_COMMANDS: dict[str, list[str]] = {
-    "log.txt": [
-        "git",
-        "log",
-        "--color=always",
-        f"--pretty=format:{_LOG_FORMAT}",
-    ],
-    "log_all.txt": [
-        "git",
-        "log",
-        "--all",
-        "--graph",
-        "--color=always",
-        f"--pretty=format:{_LOG_FORMAT}",
-    ],
-    "status.txt": ["git", "-c", "color.status=always", "status"],
-    "branch.txt": ["git", "branch", "-vv", "--color=always"],
-    "diff_stat.txt": ["git", "diff", "--stat", "--color=always"],
-    "diff.txt": ["git", "diff", "--color=always"],
-}
+# (output filename, git argv) pairs, in collection order. Only ever walked
+# front to back, so a plain tuple rather than a dict.
+GIT_COMMANDS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    (
+        "log.txt",
+        (
+            "git",
+            "log",
+            "--color=always",
+            f"--pretty=format:{_LOG_FORMAT}",
+        ),
+    ),
+    (
+        "log_all.txt",
+        (
+            "git",
+            "log",
+            "--all",
+            "--graph",
+            "--color=always",
+            f"--pretty=format:{_LOG_FORMAT}",
+        ),
+    ),
+    ("status.txt", ("git", "-c", "color.status=always", "status")),
+    # Same without the untracked walk (the slow part on big worktrees) or the
+    # upstream ahead/behind count: what `rgit status` / `repo status` show.
+    (
+        "status_fast.txt",
+        (
+            "git",
+            "-c",
+            "color.status=always",
+            "status",
+            "--untracked-files=no",
+            "--no-ahead-behind",
+        ),
+    ),
+    ("branch.txt", ("git", "branch", "-vv", "--color=always")),
+    ("diff_stat.txt", ("git", "diff", "--stat", "--color=always")),
+    ("diff.txt", ("git", "diff", "--color=always")),
+)
 
 
 def detect_repo_from_cwd(meta_dir: Path) -> Optional[str]:
-    """Infer which repo the cwd belongs to by matching against meta_dir subdirs."""
-    if not meta_dir.is_dir():
-        return None
+    """Infer which repo the cwd belongs to by matching against meta_dir subdirs.
 
+    A repo is always a direct child of sync_root, so the candidate is just the
+    first component of cwd relative to it: one stat, no scan of meta_dir.
+    """
     sync_root = meta_dir.parent
-    known_repos = {d.name for d in meta_dir.iterdir() if d.is_dir()}
-
-    for start in (Path.cwd(), Path.cwd().resolve()):
-        d = start
-        while d != sync_root and d.as_posix() != "/":
-            if d.name in known_repos and d.parent == sync_root:
-                return d.name
-            d = d.parent
+    cwd = Path.cwd()
+    tries = [(cwd, sync_root)]
+    # getcwd() is already physical, but SYNC_ROOT may be configured through a
+    # symlink; compare fully resolved paths too, only when they differ.
+    resolved = (cwd.resolve(), sync_root.resolve())
+    if resolved != tries[0]:
+        tries.append(resolved)
+    for start, root in tries:
+        try:
+            parts = start.relative_to(root).parts
+        except ValueError:
+            continue
+        if parts and os.path.isdir(os.path.join(meta_dir, parts[0])):
+            return parts[0]
 
     return None
 
 
-def write_if_changed(path: Path, content: str) -> bool:
-    """Write content to path only if it differs from existing. Returns True if written."""
-    if path.exists() and path.read_text() == content:
-        return False
-    path.write_text(content)
+def dumps_worktree_map(wt_map: dict[str, list[dict]]) -> bytes:
+    """Serialize the worktree map as indented JSON bytes (newline-terminated).
+
+    worktrees.json is read on every rgit call, so both directions go through
+    orjson when it is installed (read_worktree_map parses the raw bytes).
+    """
+    if (orjson := optional_orjson()) is not None:
+        return orjson.dumps(wt_map, option=orjson.OPT_INDENT_2) + b"\n"
+    import json  # lazy: only the no-orjson fallback needs it
+
+    return (json.dumps(wt_map, indent=2) + "\n").encode()
+
+
+def write_if_changed(path: Path, content: str | bytes) -> bool:
+    """Write content to path only if it differs from existing. Returns True if written.
+
+    Compared and written as bytes: git output is passed through undecoded.
+    """
+    data = content.encode() if isinstance(content, str) else content
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
     return True
 
 
-def collect_repo(
-    repo_name: str, sync_root: Path, meta_dir: Path, log_limit: int = 200
-) -> None:
-    """Run git commands for a single repo and write output to meta_dir."""
+# Collection is bound by git process spawns, not CPU: threads just sit in
+# wait() while git walks the object store.
+_COLLECT_WORKERS = min(32, (os.cpu_count() or 4) * 2)
+
+
+def _no_optional_locks(cmd: Iterable[str]) -> tuple[str, ...]:
+    """Insert ``--no-optional-locks`` after ``git``.
+
+    All of a repo's commands run at once, and ``git status`` would otherwise
+    take index.lock to write back its refreshed stat cache, racing the other
+    readers (the flag exists for exactly this kind of background tool).
+    """
+    git, *rest = cmd
+    return (git, "--no-optional-locks", *rest) if git == "git" else (git, *rest)
+
+
+def _resolve_argvs(
+    commands: Iterable[tuple[str, Iterable[str]]], log_limit: int
+) -> tuple[tuple[str, tuple[str, ...]], ...]:
+    """Final argv per output file, with ``-<log_limit>`` on the log commands.
+
+    Built once per collection run and shared by every repo's jobs.
+    """
+    return tuple(
+        (
+            filename,
+            _no_optional_locks(
+                (*cmd, f"-{log_limit}") if filename.startswith("log") else cmd
+            ),
+        )
+        for filename, cmd in commands
+    )
+
+
+def _git_jobs(
+    repo_name: str,
+    sync_root: Path,
+    meta_dir: Path,
+    argvs: tuple[tuple[str, tuple[str, ...]], ...],
+) -> list[tuple[tuple[str, ...], Path, Path]]:
+    """(argv, cwd, output file) for each ``argvs`` entry; [] for a non-repo."""
     repo_dir = sync_root / repo_name
     if not repo_dir.is_dir() or not (repo_dir / ".git").exists():
-        return
+        return []
 
     output_dir = meta_dir / repo_name
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    for filename, cmd in GIT_COMMANDS.items():
-        full_cmd = list(cmd)
-        if filename.startswith("log"):
-            full_cmd.append(f"-{log_limit}")
+    return [(argv, repo_dir, output_dir / filename) for filename, argv in argvs]
 
-        result = subprocess.run(
-            full_cmd,
-            cwd=repo_dir,
-            capture_output=True,
-            text=True,
-        )
-        write_if_changed(output_dir / filename, result.stdout)
+
+def _run_git_job(cmd: tuple[str, ...], cwd: Path, out_path: Path) -> None:
+    # Raw bytes straight to disk: no decode/re-encode of multi-MB diffs, and
+    # stderr (never read) isn't buffered at all.
+    result = subprocess.run(
+        cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+    write_if_changed(out_path, result.stdout)
+
+
+# Worktree-vs-index diffs: empty on a clean repo, yet each still walks the
+# whole worktree. One `git diff --quiet` probe decides for both.
+_WORKTREE_DIFF_FILES = frozenset({"diff.txt", "diff_stat.txt"})
+
+
+def _run_worktree_diff_jobs(jobs: list[tuple[tuple[str, ...], Path, Path]]) -> None:
+    """Run a repo's diff jobs only if ``git diff --quiet`` reports changes;
+    on a clean repo just write their (empty) output."""
+    clean = (
+        subprocess.run(
+            _no_optional_locks(["git", "diff", "--quiet"]),
+            cwd=jobs[0][1],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        ).returncode
+        == 0
+    )
+    for cmd, cwd, out_path in jobs:
+        if clean:
+            write_if_changed(out_path, b"")
+        else:
+            _run_git_job(cmd, cwd, out_path)
+
+
+def _submit_repo(
+    pool: ThreadPoolExecutor, jobs: list[tuple[tuple[str, ...], Path, Path]]
+) -> list[Future]:
+    diff_jobs = [job for job in jobs if job[2].name in _WORKTREE_DIFF_FILES]
+    futures = [
+        pool.submit(_run_git_job, *job)
+        for job in jobs
+        if job[2].name not in _WORKTREE_DIFF_FILES
+    ]
+    if diff_jobs:
+        futures.append(pool.submit(_run_worktree_diff_jobs, diff_jobs))
+    return futures
+
+
+def collect_repos(
+    repo_names: Iterable[str],
+    sync_root: Path,
+    meta_dir: Path,
+    log_limit: int = 200,
+    commands: Iterable[tuple[str, Iterable[str]]] = GIT_COMMANDS,
+) -> Iterator[str]:
+    """Collect metadata for several repos, yielding each name (in input order)
+    once all of its files are written.
+
+    Every (repo, git command) pair is submitted to one shared pool, so wall
+    time tracks the slowest few git commands rather than the sum over repos.
+    The worktree diffs are skipped on clean repos (see _WORKTREE_DIFF_FILES).
+    ``commands`` is (output filename, git argv) pairs (GIT_COMMANDS by default).
+    """
+    repo_names = list(repo_names)
+    argvs = _resolve_argvs(commands, log_limit)
+    # lazy: concurrent.futures (+ logging) is a noticeable slice of rgit's
+    # startup, and only collection needs it.
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=_COLLECT_WORKERS) as pool:
+        futures = {
+            repo: _submit_repo(pool, _git_jobs(repo, sync_root, meta_dir, argvs))
+            for repo in repo_names
+        }
+        for repo in repo_names:
+            for future in futures[repo]:
+                future.result()
+            yield repo
+
+
+def collect_repo(
+    repo_name: str, sync_root: Path, meta_dir: Path, log_limit: int = 200
+) -> None:
+    """Run git commands for a single repo and write output to meta_dir."""
+    for _ in collect_repos([repo_name], sync_root, meta_dir, log_limit):
+        pass
 
 
 class GitMetaReader:
     def __init__(self, meta_dir: Path):
         self.meta_dir = meta_dir
+        # (repo, filename) -> content. Collected metadata doesn't change while
+        # one rgit command runs, so each file is read at most once per reader.
+        self._files: dict[tuple[str, str], str] = {}
 
     def list_repos(self) -> list[str]:
-        if not self.meta_dir.is_dir():
+        try:
+            with os.scandir(self.meta_dir) as it:
+                return sorted(
+                    e.name
+                    for e in it
+                    if e.is_dir() and os.path.exists(os.path.join(e.path, "log.txt"))
+                )
+        except (FileNotFoundError, NotADirectoryError):
             return []
-        return sorted(
-            d.name
-            for d in self.meta_dir.iterdir()
-            if d.is_dir() and (d / "log.txt").exists()
-        )
 
     def read_worktree_map(self) -> dict[str, list[dict]]:
-        wt_file = self.meta_dir / WORKTREE_MAP_FILE
-        if not wt_file.exists():
+        try:
+            data = (self.meta_dir / WORKTREE_MAP_FILE).read_bytes()
+        except FileNotFoundError:
             return {}
-        return json.loads(wt_file.read_text())
+        if (orjson := optional_orjson()) is not None:
+            return orjson.loads(data)
+        import json  # lazy: only the no-orjson fallback needs it
+
+        return json.loads(data)
 
     def read_file(self, repo: str, filename: str) -> str:
-        meta_file = self.meta_dir / repo / filename
-        if not meta_file.exists():
-            raise FileNotFoundError(f"Metadata file not found: {meta_file}")
-        return meta_file.read_text()
+        # Same read + decode as read_all: both fill one cache, so a file's
+        # content must not depend on which method read it first.
+        return self.read_all(repo, (filename,))[filename]
+
+    def read_all(
+        self,
+        repo: str,
+        filenames: Iterable[str],
+        fallbacks: Optional[Mapping[str, str]] = None,
+    ) -> dict[str, str]:
+        """Read several of ``repo``'s metadata files at once: the repo dir is
+        joined once, and each file is one raw open + decode (cached like
+        read_file). A missing file listed in ``fallbacks`` is read from its
+        fallback instead (e.g. metadata from an older collector); otherwise
+        raises FileNotFoundError on the first missing file.
+        """
+        repo_dir = os.path.join(self.meta_dir, repo)
+        out: dict[str, str] = {}
+        for filename in filenames:
+            key = (repo, filename)
+            if key not in self._files:
+                meta_file = os.path.join(repo_dir, filename)
+                try:
+                    with open(meta_file, "rb") as f:
+                        self._files[key] = f.read().decode()
+                except FileNotFoundError:
+                    if fallbacks and filename in fallbacks:
+                        fallback = fallbacks[filename]
+                        self._files[key] = self.read_all(repo, (fallback,))[fallback]
+                    else:
+                        raise FileNotFoundError(
+                            f"Metadata file not found: {meta_file}"
+                        ) from None
+            out[filename] = self._files[key]
+        return out
 
     def read_log(self, repo: str) -> str:
         return self.read_file(repo, "log.txt")
@@ -16,22 +16,23 @@ Usage:
     rgit id use <profile>      # switch identity
 """
 
-import json
+import os
 import re
+import shlex
 import subprocess
 from dataclasses import dataclass
-from importlib.metadata import distributions
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional
 
 import typer
-import yaml
 
 from my_toolbox.config import (
     RGIT_PROFILES,
     SyncRootNotSetError,
     get_meta_dir,
     get_sync_root,
+    yaml_safe_dump,
+    yaml_safe_load,
 )
 from my_toolbox.git.git_meta import GitMetaReader, detect_repo_from_cwd
 from my_toolbox.ui import bold, cyan_text, dim, green_text, red_text, yellow_text
@@ -70,7 +71,8 @@ def _require_meta() -> tuple[Path, GitMetaReader]:
 
 
 def _strip_ansi(text: str) -> str:
-    return _ANSI_RE.sub("", text)
+    # Most metadata lines carry no color at all; skip the regex for those.
+    return _ANSI_RE.sub("", text) if "\x1b" in text else text
 
 
 def _resolve_repo(repo: Optional[str]) -> str:
@@ -91,35 +93,76 @@ def _resolve_repo(repo: Optional[str]) -> str:
 def _read_or_exit(repo: str, filename: str) -> str:
     _, reader = _require_meta()
     try:
-        return reader.read_file(repo, filename)
+        return reader.read_all(repo, (filename,), _META_FALLBACKS)[filename]
     except FileNotFoundError as e:
         typer.echo(f"Error: {e}", err=True)
         raise typer.Exit(1) from e
 
 
+# Files newer collectors add -> the older file that can stand in for them, so
+# metadata collected before (or synced from a host without) the new file
+# still renders instead of aborting.
+_META_FALLBACKS = {"status_fast.txt": "status.txt"}
+
+_REPO_STATUS_FILES = (
+    "branch.txt",
+    "status_fast.txt",
+    "diff_stat.txt",
+    "log_all.txt",
+)
+
+
+def _read_all_or_exit(
+    repos: list[str], filenames: tuple[str, ...]
+) -> Iterator[dict[str, str]]:
+    """``reader.read_all`` for every repo, yielded in repo order.
+
+    The reads are independent and the synced meta dir may sit on slow or
+    cold storage, so they fan out over a thread pool up front.
+    """
+    # lazy: only `repo status` reads many repos at once.
+    from concurrent.futures import ThreadPoolExecutor
+
+    _, reader = _require_meta()
+    with ThreadPoolExecutor(max_workers=min(32, len(repos) or 1)) as pool:
+        futures = [
+            pool.submit(reader.read_all, repo, filenames, _META_FALLBACKS)
+            for repo in repos
+        ]
+        for future in futures:
+            try:
+                yield future.result()
+            except FileNotFoundError as e:
+                typer.echo(f"Error: {e}", err=True)
+                raise typer.Exit(1) from e
+
+
 def _detect_installed_worktrees(sync_root: Path) -> dict[str, str]:
     """Return {worktree_dir_name: package_name} for editable installs under sync_root."""
+    # lazy: importlib.metadata (+ its email.* deps) and json are the bulk of
+    # rgit's import time, and only `rgit worktree` needs them.
+    import json
+    from importlib.metadata import distributions
+
+    url_prefix = f"file://{sync_root.as_posix().rstrip('/')}/"
     installed: dict[str, str] = {}
     for dist in distributions():
         direct_url_text = dist.read_text("direct_url.json")
-        if not direct_url_text:
+        # Cheap substring test before parsing: most installs aren't editable.
+        if not direct_url_text or "editable" not in direct_url_text:
             continue
         try:
             info = json.loads(direct_url_text)
-        except (json.JSONDecodeError, ValueError):
+        except ValueError:
             continue
         if not info.get("dir_info", {}).get("editable"):
             continue
         url = info.get("url", "")
-        if not url.startswith("file:///"):
-            continue
-        pkg_path = Path(url.removeprefix("file://"))
-        try:
-            rel = pkg_path.relative_to(sync_root)
-        except ValueError:
+        if not url.startswith(url_prefix):
             continue
-        if rel.parts:
-            installed[rel.parts[0]] = dist.metadata["Name"]
+        top = url[len(url_prefix) :].split("/", 1)[0]
+        if top:
+            installed[top] = dist.metadata["Name"]
     return installed
 
 
@@ -154,10 +197,13 @@ def show_status(
     repo: Optional[str] = typer.Argument(
         None, help="Repository name (auto-detected from cwd if omitted)"
     ),
+    with_untracked: bool = typer.Option(
+        False, "--with-untracked", "-u", help="Include untracked files"
+    ),
 ):
     """Show the git status for a repo."""
     repo = _resolve_repo(repo)
-    page(_read_or_exit(repo, "status.txt"))
+    page(_read_or_exit(repo, "status.txt" if with_untracked else "status_fast.txt"))
 
 
 @app.command("branch")
@@ -200,6 +246,15 @@ def show_diff(
 repo_app = typer.Typer(help="Multi-repo operations.")
 
 
+# `git status` section headers (text before the colon) -> _parse_status_lines
+# bucket.
+_STATUS_SECTIONS = {
+    "Changes to be committed": "staged",
+    "Changes not staged for commit": "unstaged",
+    "Untracked files": "untracked",
+}
+
+
 def _parse_status_lines(status_content: str) -> dict[str, list[str]]:
     """Parse git status output into {"staged": [...], "unstaged": [...],
     "untracked": [...]} with original colored lines."""
@@ -211,15 +266,16 @@ def _parse_status_lines(status_content: str) -> dict[str, list[str]]:
     section = ""
 
     for line in status_content.splitlines():
-        plain = _strip_ansi(line)
-        if "Changes to be committed" in plain:
-            section = "staged"
-        elif "Changes not staged for commit" in plain:
-            section = "unstaged"
-        elif "Untracked files" in plain:
-            section = "untracked"
-        elif plain.startswith("\t") and section:
-            result[section].append(line)
+        # By default only entries are colored, after their leading tab, and
+        # headers are plain, so no stripping is needed. color.status.header
+        # wraps every line (headers and the entries' tab) in escapes; only
+        # lines that start with ESC pay for the strip.
+        plain = _strip_ansi(line) if line.startswith("\x1b") else line
+        if plain.startswith("\t"):
+            if section:
+                result[section].append(line)
+        else:
+            section = _STATUS_SECTIONS.get(plain.partition(":")[0], section)
 
     return result
 
@@ -249,37 +305,44 @@ def repo_status():
         raise typer.Exit(0)
 
     out: list[str] = []
-    for repo in repos:
+    for repo, files in zip(repos, _read_all_or_exit(repos, _REPO_STATUS_FILES)):
         out.append(f"\n{'='*60}")
         out.append(f"  {repo}")
         out.append(f"{'='*60}")
 
-        branch_content = _read_or_exit(repo, "branch.txt")
-        for line in branch_content.splitlines():
-            if _strip_ansi(line).startswith("*"):
-                out.append(f"  Branch: {line.strip()}")
-                break
+        # Strip ANSI in one pass over the whole file; stripping never removes
+        # a newline, so line indices still line up with the colored original.
+        branch_content = files["branch.txt"]
+        plain_lines = _strip_ansi(branch_content).splitlines()
+        current = next(
+            (i for i, line in enumerate(plain_lines) if line.startswith("*")), None
+        )
+        if current is not None:
+            out.append(f"  Branch: {branch_content.splitlines()[current].strip()}")
 
-        status_content = _read_or_exit(repo, "status.txt")
+        status_content = files["status_fast.txt"]
         parsed = _parse_status_lines(status_content)
 
-        for category in ("staged", "unstaged", "untracked"):
+        # Tracked changes only: status_fast.txt never lists untracked files
+        # (`rgit status -u <repo>` does), and the status.txt fallback for old
+        # metadata shouldn't make the summary differ.
+        for category in ("staged", "unstaged"):
             if parsed[category]:
                 out.append(f"  {category.capitalize()}:")
                 for line in parsed[category]:
                     out.append(f"  {line}")
 
-        if not any(parsed.values()):
+        if not (parsed["staged"] or parsed["unstaged"]):
             status_lines = status_content.strip().splitlines()
             if status_lines:
                 out.append(f"  Status: {status_lines[-1].strip()}")
 
-        diff_stat_content = _read_or_exit(repo, "diff_stat.txt").strip()
+        diff_stat_content = files["diff_stat.txt"].strip()
         if diff_stat_content:
             last_line = diff_stat_content.splitlines()[-1].strip()
             out.append(f"  Diff:   {last_line}")
 
-        log_content = _read_or_exit(repo, "log_all.txt")
+        log_content = files["log_all.txt"]
         for line in log_content.splitlines():
             plain = _strip_ansi(line).strip().lstrip("* |/\\")
             if plain:
@@ -303,7 +366,7 @@ def collect(
     ),
 ) -> None:
     """Refresh git metadata for repos under sync_root."""
-    from my_toolbox.git.git_meta import collect_repo
+    from my_toolbox.git.git_meta import collect_repo, collect_repos
 
     meta_dir, _ = _require_meta()
     sync_root = meta_dir.parent
@@ -316,15 +379,17 @@ def collect(
             typer.echo(f"error: SYNC_ROOT does not exist: {sync_root}", err=True)
             raise typer.Exit(1)
 
-        repos = sorted(
-            d.name for d in sync_root.iterdir() if d.is_dir() and (d / ".git").exists()
-        )
+        with os.scandir(sync_root) as it:
+            repos = sorted(
+                e.name
+                for e in it
+                if e.is_dir() and os.path.exists(os.path.join(e.path, ".git"))
+            )
         if not repos:
             typer.echo("No git repos found under SYNC_ROOT.")
             raise typer.Exit(0)
 
-        for r in repos:
-            collect_repo(r, sync_root, meta_dir)
+        for r in collect_repos(repos, sync_root, meta_dir):
             typer.echo(f"{green_text('✓')} {r}")
 
 
@@ -461,24 +526,59 @@ app.add_typer(worktree_app, name="worktree")
 id_app = typer.Typer(help="Git identity management.")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class _Profile:
     name: str
     email: str
     gh_user: Optional[str] = None
 
 
+# (st_mtime_ns, st_size, profiles, email -> key) of the last load/save: repeat
+# loads in one process skip the YAML parse until the file changes on disk.
+_profiles_cache: tuple[int, int, Dict[str, _Profile], Dict[str, str]] | None = None
+
+
+def _index_by_email(profiles: Dict[str, _Profile]) -> Dict[str, str]:
+    """email -> profile key; the first profile wins on a shared email."""
+    index: Dict[str, str] = {}
+    for key, p in profiles.items():
+        index.setdefault(p.email, key)
+    return index
+
+
 def _load_profiles() -> Dict[str, _Profile]:
-    if not RGIT_PROFILES.exists():
+    """Return the profiles as a fresh dict (callers like `id add` mutate it)."""
+    global _profiles_cache
+    try:
+        st = RGIT_PROFILES.stat()
+    except FileNotFoundError:
+        _profiles_cache = None
         return {}
-    raw = yaml.safe_load(RGIT_PROFILES.read_text()) or {}
-    return {
+    if _profiles_cache and _profiles_cache[:2] == (st.st_mtime_ns, st.st_size):
+        return dict(_profiles_cache[2])
+
+    # Binary handle: libyaml reads + decodes the UTF-8 itself, no str copy.
+    with RGIT_PROFILES.open("rb") as f:
+        raw = yaml_safe_load(f) or {}
+    profiles = {
         key: _Profile(name=val["name"], email=val["email"], gh_user=val.get("gh_user"))
         for key, val in raw.get("profiles", {}).items()
     }
+    _profiles_cache = (st.st_mtime_ns, st.st_size, profiles, _index_by_email(profiles))
+    return dict(profiles)
+
+
+def _load_email_index() -> Dict[str, str]:
+    """email -> profile key for the current profiles file (built once per load)."""
+    _load_profiles()
+    return _profiles_cache[3] if _profiles_cache else {}
+
+
+_PROFILES_DUMP_KW = {"default_flow_style": False, "allow_unicode": True}
 
 
 def _save_profiles(profiles: Dict[str, _Profile]) -> None:
+    global _profiles_cache
     RGIT_PROFILES.parent.mkdir(parents=True, exist_ok=True)
     data = {
         "profiles": {
@@ -490,76 +590,124 @@ def _save_profiles(profiles: Dict[str, _Profile]) -> None:
             for key, p in profiles.items()
         }
     }
-    RGIT_PROFILES.write_text(
-        yaml.dump(data, default_flow_style=False, allow_unicode=True)
+    # encoding= makes the emitter produce UTF-8 bytes directly.
+    new_bytes = yaml_safe_dump(data, encoding="utf-8", **_PROFILES_DUMP_KW)
+    try:
+        unchanged = RGIT_PROFILES.read_bytes() == new_bytes
+    except FileNotFoundError:
+        unchanged = False
+    if not unchanged:
+        # tmp + os.replace: a crash mid-write never leaves a torn profiles file.
+        tmp = RGIT_PROFILES.with_suffix(".yaml.tmp")
+        tmp.write_bytes(new_bytes)
+        os.replace(tmp, RGIT_PROFILES)
+    st = RGIT_PROFILES.stat()
+    _profiles_cache = (
+        st.st_mtime_ns,
+        st.st_size,
+        dict(profiles),
+        _index_by_email(profiles),
     )
 
 
-def _git_config_get(key: str, *, scope: Optional[str] = None) -> Optional[str]:
-    cmd = ["git", "config"]
-    if scope:
-        cmd.append(f"--{scope}")
-    cmd.append(key)
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    return result.stdout.strip() if result.returncode == 0 else None
+def _parse_config_list(output: str) -> Dict[str, Dict[str, str]]:
+    """Parse ``git config --list --show-scope -z`` into ``{scope: {key: value}}``.
 
+    The output is NUL-separated ``scope``, ``key\nvalue`` fields in precedence
+    order (system, global, local, worktree, command), so scope keys iterate low
+    to high priority and a repeated key keeps its last value.
+    """
+    snapshot: Dict[str, Dict[str, str]] = {}
+    fields = output.split("\0")
+    for scope, entry in zip(fields[0::2], fields[1::2]):
+        key, _, value = entry.partition("\n")
+        snapshot.setdefault(scope, {})[key] = value
+    return snapshot
 
-def _git_config_set(key: str, value: str, *, is_global: bool = False) -> None:
-    cmd = ["git", "config"]
-    if is_global:
-        cmd.append("--global")
-    cmd.extend([key, value])
-    subprocess.run(cmd, check=True)
 
+def _git_config_snapshot() -> Dict[str, Dict[str, str]]:
+    """All git config entries as ``{scope: {key: value}}`` from one git spawn."""
+    result = subprocess.run(
+        ["git", "config", "--list", "--show-scope", "-z"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return {}
+    return _parse_config_list(result.stdout)
+
+
+def _git_toplevel_and_config() -> tuple[Optional[str], Dict[str, Dict[str, str]]]:
+    """Repo toplevel (None outside a repo) plus the config snapshot, from a
+    single ``sh -c``. A NUL -- which no path contains -- separates the two.
+    """
+    script = (
+        "git rev-parse --show-toplevel 2>/dev/null; printf '\\0'; "
+        "git config --list --show-scope -z 2>/dev/null"
+    )
+    result = subprocess.run(["sh", "-c", script], capture_output=True, text=True)
+    toplevel, _, config = result.stdout.partition("\0")
+    return toplevel.strip() or None, _parse_config_list(config)
 
-def _match_profile(
-    profiles: Dict[str, _Profile], email: Optional[str]
+
+def _git_config_effective(
+    snapshot: Dict[str, Dict[str, str]], key: str
 ) -> Optional[str]:
-    if not email:
-        return None
-    for key, p in profiles.items():
-        if p.email == email:
-            return key
+    """The value git itself would resolve for ``key`` (highest scope wins)."""
+    for entries in reversed(snapshot.values()):
+        if key in entries:
+            return entries[key]
     return None
 
 
+def _git_config_set(entries: Dict[str, str], *, is_global: bool = False) -> None:
+    """Set several keys with a single spawn: one ``sh -c`` running an
+    ``&&``-chained ``git config`` per key (git can't set two keys at once).
+    """
+    scope = "--global" if is_global else "--local"
+    script = " && ".join(
+        shlex.join(["git", "config", scope, key, value])
+        for key, value in entries.items()
+    )
+    subprocess.run(["sh", "-c", script], check=True)
+
+
+def _match_profile(email_index: Dict[str, str], email: Optional[str]) -> Optional[str]:
+    return email_index.get(email) if email else None
+
+
 def _format_identity(
-    name: Optional[str], email: Optional[str], profiles: Dict[str, _Profile]
+    name: Optional[str], email: Optional[str], email_index: Dict[str, str]
 ) -> str:
-    matched = _match_profile(profiles, email)
+    matched = _match_profile(email_index, email)
     identity = f"{name or '(not set)'} <{email or '(not set)'}>"
     if matched:
         return f"{bold(identity)}  {green_text(matched)}"
     return bold(identity)
 
 
+# `gh auth status`: "  ✓ Logged in to github.com account <user> (keyring)"
+_GH_LOGIN_RE = re.compile(r"Logged in to \S+ account (\S+)")
+
+
 def _gh_active_user() -> Optional[str]:
     result = subprocess.run(["gh", "auth", "status"], capture_output=True, text=True)
-    output = result.stdout + result.stderr
-    for line in output.splitlines():
-        if "Logged in to" in line and "Active account: true" not in line:
-            parts = line.strip().split("account ")
-            if len(parts) > 1:
-                return parts[1].split()[0].strip()
-    return None
+    m = _GH_LOGIN_RE.search(result.stdout + result.stderr)
+    return m.group(1) if m else None
 
 
 @id_app.command("show")
 def id_show() -> None:
     """Show the current repo's git identity."""
-    toplevel = subprocess.run(
-        ["git", "rev-parse", "--show-toplevel"], capture_output=True, text=True
-    )
-    repo_path = (
-        toplevel.stdout.strip() if toplevel.returncode == 0 else "(not a git repo)"
-    )
+    toplevel, config = _git_toplevel_and_config()
+    repo_path = toplevel or "(not a git repo)"
 
-    profiles = _load_profiles()
+    email_index = _load_email_index()
 
-    local_name = _git_config_get("user.name", scope="local")
-    local_email = _git_config_get("user.email", scope="local")
-    global_name = _git_config_get("user.name", scope="global")
-    global_email = _git_config_get("user.email", scope="global")
+    local = config.get("local", {})
+    local_name, local_email = local.get("user.name"), local.get("user.email")
+    global_ = config.get("global", {})
+    global_name, global_email = global_.get("user.name"), global_.get("user.email")
 
     gh_user = _gh_active_user()
 
@@ -567,7 +715,7 @@ def id_show() -> None:
     typer.echo(f"gh:      {bold(gh_user) if gh_user else dim('(not logged in)')}")
 
     if local_name or local_email:
-        typer.echo(f"local:   {_format_identity(local_name, local_email, profiles)}")
+        typer.echo(f"local:   {_format_identity(local_name, local_email, email_index)}")
     else:
         typer.echo(f"local:   {dim('(not set)')}")
 
@@ -582,8 +730,8 @@ def id_list() -> None:
         typer.echo("No profiles configured. Use 'rgit id add' to create one.")
         raise typer.Exit()
 
-    cur_email = _git_config_get("user.email")
-    matched = _match_profile(profiles, cur_email)
+    cur_email = _git_config_effective(_git_config_snapshot(), "user.email")
+    matched = _match_profile(_load_email_index(), cur_email)
 
     for key, p in profiles.items():
         marker = green_text("* ") if key == matched else "  "
@@ -605,8 +753,7 @@ def id_use(
 
     p = profiles[profile]
     scope = "global" if is_global else "local"
-    _git_config_set("user.name", p.name, is_global=is_global)
-    _git_config_set("user.email", p.email, is_global=is_global)
+    _git_config_set({"user.name": p.name, "user.email": p.email}, is_global=is_global)
     typer.echo(f"Switched to {green_text(profile)} ({scope}): {p.name} <{p.email}>")
 
     if p.gh_user:
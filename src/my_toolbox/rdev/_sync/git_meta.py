@@ -6,40 +6,45 @@ so that it can be rsynced to remote servers that lack .git directories.
 
 from __future__ import annotations
 
-import json
-import subprocess
-from concurrent.futures import ThreadPoolExecutor
-
-from my_toolbox.git.git_meta import GIT_COMMANDS, WORKTREE_MAP_FILE, write_if_changed
+from typing import Iterable, Iterator
+
+from my_toolbox.git.git_meta import (
+    GIT_COMMANDS,
+    WORKTREE_MAP_FILE,
+    collect_repos,
+    dumps_worktree_map,
+    write_if_changed,
+)
 from my_toolbox.rdev._sync.sync_tree import SyncTree
 from my_toolbox.ui import green_text, section_header
 
 
 class GitMetaCollector:
-    def __init__(self, tree: SyncTree, log_limit: int = 200):
+    """SyncTree-aware front end over git_meta.collect_repos (the one
+    collection implementation, shared with `rgit collect`)."""
+
+    def __init__(
+        self,
+        tree: SyncTree,
+        log_limit: int = 200,
+        commands: Iterable[tuple[str, Iterable[str]]] = GIT_COMMANDS,
+    ):
         self.tree = tree
         self.log_limit = log_limit
+        self.commands = commands
 
-    def collect_repo(self, repo_name: str) -> None:
-        repo_dir = self.tree.sync_root / repo_name
-        if not self.tree.is_git_repo(repo_dir):
-            return
-
-        output_dir = self.tree.git_meta_dir / repo_name
-        output_dir.mkdir(parents=True, exist_ok=True)
+    def _collect(self, repo_names: list[str]) -> Iterator[str]:
+        return collect_repos(
+            repo_names,
+            self.tree.sync_root,
+            self.tree.git_meta_dir,
+            self.log_limit,
+            self.commands,
+        )
 
-        for filename, cmd in GIT_COMMANDS.items():
-            full_cmd = list(cmd)
-            if filename.startswith("log"):
-                full_cmd.append(f"-{self.log_limit}")
-
-            result = subprocess.run(
-                full_cmd,
-                cwd=repo_dir,
-                capture_output=True,
-                text=True,
-            )
-            write_if_changed(output_dir / filename, result.stdout)
+    def collect_repo(self, repo_name: str) -> None:
+        for _ in self._collect([repo_name]):
+            pass
 
     def _write_worktree_map(self) -> None:
         wt_map = self.tree.discover_worktree_map()
@@ -50,7 +55,7 @@ class GitMetaCollector:
         meta_dir.mkdir(parents=True, exist_ok=True)
 
         out_path = meta_dir / WORKTREE_MAP_FILE
-        write_if_changed(out_path, json.dumps(wt_map, indent=2) + "\n")
+        write_if_changed(out_path, dumps_worktree_map(wt_map))
         print(f"  {green_text('✓')} {WORKTREE_MAP_FILE}")
 
     def collect_all(self, repo_names=None) -> None:
@@ -67,17 +72,13 @@ class GitMetaCollector:
             repos = [r for r in repos if r in wanted]
 
         # Each repo writes its own commit_msg/<repo>/ dir, so collection is
-        # independent across repos. The cost is dominated by subprocess-spawn
-        # count (6 git commands x N repos), not by any single slow command, so
-        # threads parallelize it well. Print in repo order for tidy output.
-        with ThreadPoolExecutor(max_workers=8) as pool:
-            futures = {r: pool.submit(self.collect_repo, r) for r in repos}
-            for repo_name in repos:
-                futures[repo_name].result()
-                relative = (self.tree.git_meta_dir / repo_name).relative_to(
-                    self.tree.sync_root
-                )
-                print(f"  {green_text('✓')} {repo_name:<12} -> {relative}")
+        # independent across repos; collect_repos fans every (repo, command)
+        # pair out to one pool and yields repos in order for tidy output.
+        for repo_name in self._collect(repos):
+            relative = (self.tree.git_meta_dir / repo_name).relative_to(
+                self.tree.sync_root
+            )
+            print(f"  {green_text('✓')} {repo_name:<12} -> {relative}")
 
         # worktree_map is small + cheap; always refresh so partial syncs still
         # surface the latest worktree layout.
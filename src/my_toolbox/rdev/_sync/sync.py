@@ -1,7 +1,11 @@
+import codecs
+import os
+import selectors
 import shlex
+import shutil
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 import typer
 
@@ -45,7 +49,6 @@ def _rsync_target(host: str, remote_dir: str) -> str:
 
 
 def _sync_command(
-    remote_dir: str,
     local_dir: str,
     tree: SyncTree,
     delete: bool = False,
@@ -54,9 +57,10 @@ def _sync_command(
     quiet: bool = False,
     only_dirs: Optional[list[str]] = None,
     dry_run: bool = False,
-):
+) -> list[str]:
+    """rsync argv up to and including the sources. It is the same for every
+    host, so it is built once per sync; callers append each destination."""
     src_dir = Path(local_dir)
-    dst_dir = Path(remote_dir)
 
     use_relative = False  # use rsync -R to preserve nested paths like commit_msg/<d>/
 
@@ -81,38 +85,31 @@ def _sync_command(
         if tree.git_meta_dir.is_dir():
             src_dirs.append(tree.git_meta_dir)
 
-    # In dry-run, --info=progress2 is meaningless (nothing is transferred);
-    # swap to -v so rsync lists the would-be transfers / *deleting lines.
-    progress_arg = "" if quiet else ("-v" if dry_run else "--info=progress2")
-    rsync_cmd = [
-        "rsync",
-        "-rlth",
-        "--no-perms",
-        "--chmod=ugo=rwX",
-        "-R" if use_relative else "",
-        "--delete" if delete else "",
-        "--dry-run" if dry_run else "",
-        progress_arg,
-        f"--exclude-from={git_ignore}" if git_ignore else "",
-        f"--exclude-from={RSYNCIGNORE}",
-        "--exclude=.git" if not git_repo else "",
-    ]
+    rsync_cmd = ["rsync", "-rlth", "--no-perms", "--chmod=ugo=rwX"]
+    if use_relative:
+        rsync_cmd.append("-R")
+    if delete:
+        rsync_cmd.append("--delete")
+    if dry_run:
+        rsync_cmd.append("--dry-run")
+    if not quiet:
+        # In dry-run, --info=progress2 is meaningless (nothing is transferred);
+        # swap to -v so rsync lists the would-be transfers / *deleting lines.
+        rsync_cmd.append("-v" if dry_run else "--info=progress2")
+    if git_ignore:
+        rsync_cmd.append(f"--exclude-from={git_ignore}")
+    rsync_cmd.append(f"--exclude-from={RSYNCIGNORE}")
+    if not git_repo:
+        rsync_cmd.append("--exclude=.git")
 
     if use_relative:
         # rsync -R preserves the path *after* the `/./` marker — anchor it at src_dir.
-        src_dirs_str = [
+        rsync_cmd.extend(
             f"{src_dir.as_posix()}/./{d.relative_to(src_dir).as_posix()}".rstrip("/")
             for d in src_dirs
-        ]
+        )
     else:
-        src_dirs_str = [d.as_posix().rstrip("/") for d in src_dirs]
-    dst_dir_str = dst_dir.as_posix().rstrip("/")
-    rsync_cmd.extend(src_dirs_str)
-    rsync_cmd.append(dst_dir_str)
-
-    rsync_cmd = [cmd for cmd in rsync_cmd if cmd]
-    if not quiet:
-        typer.echo(f"\n  {dim('$ ' + ' '.join(rsync_cmd))}")
+        rsync_cmd.extend(d.as_posix().rstrip("/") for d in src_dirs)
 
     return rsync_cmd
 
@@ -140,12 +137,16 @@ class SyncTool:
 
         if self.is_full_sync:
             self.local_dir = self.tree.sync_root
-            self._remote_subpath = Path(self.local_dir.name)
         else:
             self.local_dir = Path.cwd() / file_or_path
-            self._remote_subpath = self.local_dir.relative_to(
-                self.tree.sync_root.parent
-            )
+        # <sync_root name>/...: shown in the plan / header / log, and reused as
+        # the remote subpath under each instance's sync_target_base.
+        self.relative_path = self.local_dir.relative_to(self.tree.sync_root.parent)
+        # Per-instance remote root (posix str), parallel to self.instances.
+        self.remote_roots = [
+            (inst.sync_target_base / self.relative_path).as_posix()
+            for inst in instances
+        ]
 
         self.delete = delete
         self.git_repo = git_repo
@@ -166,9 +167,8 @@ class SyncTool:
 
             logger.print_last_log()
 
-            relative_path = self.local_dir.relative_to(self.tree.sync_root.parent)
             typer.echo(section_header("Sync Plan"))
-            typer.echo(f"  Source:  {bold(str(relative_path))}")
+            typer.echo(f"  Source:  {bold(str(self.relative_path))}")
             typer.echo(f"  Target:  {format_hosts(self.hosts)}")
             if self.delete:
                 typer.echo(f"  Delete:  {yellow_text('Yes')}")
@@ -181,20 +181,69 @@ class SyncTool:
     def hosts(self) -> list[str]:
         return [i.ssh.alias for i in self.instances]
 
-    def _remote_dir_for(self, instance: Instance) -> Path:
-        return instance.sync_target_base / self._remote_subpath
-
     def _probe_gitignore(self) -> Optional[str]:
         gitignore_file = self.local_dir / ".gitignore"
         return gitignore_file.as_posix() if gitignore_file.exists() else None
 
-    def _ui_thread(self, rsync_procs: list[subprocess.Popen]):
+    @staticmethod
+    def _drain(
+        rsync_procs: list[subprocess.Popen],
+        on_stdout: Optional[Callable[[int, bytes], None]] = None,
+    ) -> list[bytes]:
+        """Pump every rsync's pipes through one selector until all hit EOF.
+
+        All procs make progress concurrently: the selector blocks until some
+        pipe is readable, then a single ``os.read`` takes whatever is buffered
+        -- no poll() spin, no per-byte reads, no thread per proc. stdout chunks
+        go to ``on_stdout(proc_index, chunk)``; stderr is buffered per proc and
+        returned in proc order (left unread, a chatty rsync would fill the pipe
+        and stall). Each proc is reaped once both its pipes hit EOF -- it has
+        exited by then, so ``wait()`` returns at once.
+        """
+        sel = selectors.DefaultSelector()
+        stderr_bufs = [bytearray() for _ in rsync_procs]
+        open_pipes = [0] * len(rsync_procs)
+        for i, p in enumerate(rsync_procs):
+            for pipe in (p.stdout, p.stderr):
+                if pipe:
+                    os.set_blocking(pipe.fileno(), False)
+                    sel.register(pipe, selectors.EVENT_READ, data=i)
+                    open_pipes[i] += 1
+
+        while sel.get_map():
+            for key, _ in sel.select():
+                i = key.data
+                try:
+                    chunk = os.read(key.fd, 4096)
+                except BlockingIOError:
+                    continue
+                if not chunk:
+                    sel.unregister(key.fileobj)
+                    open_pipes[i] -= 1
+                    if not open_pipes[i]:
+                        rsync_procs[i].wait()
+                elif key.fileobj is rsync_procs[i].stderr:
+                    stderr_bufs[i] += chunk
+                elif on_stdout:
+                    on_stdout(i, chunk)
+        sel.close()
+        return [bytes(b) for b in stderr_bufs]
+
+    def _ui_thread(self, rsync_procs: list[subprocess.Popen]) -> list[bytes]:
+        """Render each rsync's stdout on its own UI row; return buffered stderr."""
+        # Per-row incremental decoder: a multi-byte UTF-8 char may straddle
+        # two reads.
+        decoders = [
+            codecs.getincrementaldecoder("utf-8")(errors="replace") for _ in rsync_procs
+        ]
+        stderrs = [b""] * len(rsync_procs)
         with UITool.ui_tool(len(rsync_procs), desc="Rsync") as ui_tool:
-            while not all(p.poll() is not None for p in rsync_procs):
-                for i, p in enumerate(rsync_procs):
-                    if p.stdout and (char := p.stdout.read(1)):
-                        rendered_char = char if char in {"\n", "\r"} else dim(char)
-                        ui_tool.update_char(i, rendered_char)
+
+            def render(i: int, chunk: bytes) -> None:
+                ui_tool.update_chars(i, decoders[i].decode(chunk), style=dim)
+
+            stderrs = self._drain(rsync_procs, render)
+        return stderrs
 
     def _allowed_remote_dirs(self) -> set[str]:
         """Return the set of directory names that should exist on the remote."""
@@ -213,8 +262,7 @@ class SyncTool:
         allowed = self._allowed_remote_dirs()
 
         all_stale: list[tuple[Instance, str, set[str]]] = []
-        for inst in self.instances:
-            remote_root = self._remote_dir_for(inst).as_posix()
+        for inst, remote_root in zip(self.instances, self.remote_roots):
             try:
                 result = subprocess.run(
                     _ssh_argv(inst.ssh.alias) + [f"ls -1 {shlex.quote(remote_root)}"],
@@ -286,14 +334,13 @@ class SyncTool:
         though it's not a docker-root-owned file at all.
         """
         failed: list[tuple[Instance, str, str]] = []  # (instance, remote_root, path)
-        for inst in self.instances:
+        for inst, remote_root in zip(self.instances, self.remote_roots):
             # Devbox: ssh lands inside the container, files are owned by the
             # ssh user directly -- no docker-root ownership issue to fix.
             if inst.mode == "devbox":
                 continue
             if check_container(inst.ssh.alias, inst.container.name) != "running":
                 continue
-            remote_root = self._remote_dir_for(inst).as_posix()
             try:
                 result = subprocess.run(
                     _ssh_argv(inst.ssh.alias)
@@ -352,67 +399,72 @@ class SyncTool:
         # noise for everything else.
         GitMetaCollector(self.tree).collect_all(repo_names=self.only_dirs)
 
-        rsync_cmds = []
-        for inst in self.instances:
-            # trailing slash tells rsync to sync directory contents
-            is_folder = "/" if self.local_dir.is_dir() else ""
-            remote_dir = self._remote_dir_for(inst).as_posix()
-            target = _rsync_target(inst.ssh.alias, f"{remote_dir}{is_folder}")
-            rsync_cmds.append(
-                _sync_command(
-                    target,
-                    f"{self.local_dir.as_posix()}{is_folder}",
-                    self.tree,
-                    self.delete,
-                    self.git_repo,
-                    self._probe_gitignore(),
-                    quiet=self.quiet,
-                    only_dirs=self.only_dirs,
-                    dry_run=self.dry_run,
-                )
-            )
+        # trailing slash tells rsync to sync directory contents
+        is_folder = "/" if self.local_dir.is_dir() else ""
+        base_cmd = _sync_command(
+            f"{self.local_dir.as_posix()}{is_folder}",
+            self.tree,
+            self.delete,
+            self.git_repo,
+            self.git_ignore,
+            quiet=self.quiet,
+            only_dirs=self.only_dirs,
+            dry_run=self.dry_run,
+        )
+        # Destinations carry no trailing slash: the sources decide the layout.
+        rsync_cmds = [
+            [*base_cmd, _rsync_target(inst.ssh.alias, remote_root)]
+            for inst, remote_root in zip(self.instances, self.remote_roots)
+        ]
+        if not self.quiet:
+            for cmd in rsync_cmds:
+                typer.echo(f"\n  {dim('$ ' + shlex.join(cmd))}")
 
         if not self.yes:
             input(dim("\n  ⏎  Press Enter to continue..."))
         if not self.quiet:
             CursorTool.clear_screen()
 
-            relative_path = self.local_dir.relative_to(self.tree.sync_root.parent)
             typer.echo(
-                section_header(f"Syncing {relative_path} @ {format_hosts(self.hosts)}")
+                section_header(
+                    f"Syncing {self.relative_path} @ {format_hosts(self.hosts)}"
+                )
             )
 
         self._preflight_permission_check()
 
-        rsync_procs: list[subprocess.Popen] = []
-        for cmd in rsync_cmds:
-            rsync_procs.append(
-                subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE if not self.quiet else subprocess.DEVNULL,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    encoding="utf-8",
-                    errors="replace",
-                )
+        # Start every rsync before reading any output, so all hosts transfer in
+        # parallel; one selector (_drain) then services all of them. An absolute
+        # executable plus close_fds=False lets CPython spawn via posix_spawn
+        # (vfork) rather than fork+exec; our own fds are non-inheritable
+        # anyway, so nothing extra leaks into rsync.
+        rsync_exe = shutil.which("rsync")
+        rsync_procs = [
+            subprocess.Popen(
+                cmd,
+                executable=rsync_exe,
+                close_fds=False,
+                stdout=subprocess.PIPE if not self.quiet else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
             )
+            for cmd in rsync_cmds
+        ]
 
         if self.quiet:
-            for p in rsync_procs:
-                p.wait()
+            stderrs = self._drain(rsync_procs)
         else:
-            self._ui_thread(rsync_procs)
+            stderrs = self._ui_thread(rsync_procs)
 
         # Collect rsync errors, group by error type across hosts
         _KNOWN_ERRORS = ["No space left on device", "Permission denied"]
         error_hosts: dict[str, list[str]] = {}
         other_errors: list[tuple[str, str]] = []
 
-        for rsync_proc, host in zip(rsync_procs, self.hosts):
+        for rsync_proc, raw_stderr, host in zip(rsync_procs, stderrs, self.hosts):
             rsync_proc.wait()
             if rsync_proc.returncode == 0:
                 continue
-            stderr = rsync_proc.stderr.read() if rsync_proc.stderr else ""
+            stderr = (raw_stderr or b"").decode("utf-8", errors="replace")
             matched_patterns: set[str] = set()
             for line in stderr.splitlines():
                 for pattern in _KNOWN_ERRORS:
@@ -438,7 +490,7 @@ class SyncTool:
             raise typer.Exit(1)
 
         logger.log_one(
-            path=self.local_dir.relative_to(self.tree.sync_root.parent),
+            path=self.relative_path,
             hosts=self.hosts,
             delete=self.delete,
             git_repo=self.git_repo,
@@ -1,33 +1,33 @@
 import json
+import os
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Union
 
-from my_toolbox.config import RDEV_SYNC_LOG
+from my_toolbox.config import RDEV_SYNC_LOG, optional_orjson
 from my_toolbox.ui import dim, format_hosts, section_header
 
 
+@dataclass(slots=True, frozen=True)
 class LogItem:
-    def __init__(
-        self,
-        now_str: str,
-        path: str,
-        hosts: str,
-        delete: bool,
-        git_repo: bool,
-    ):
-        self.now_str = now_str
-        self.path = path
-        self.hosts = hosts
-        self.delete = delete
-        self.git_repo = git_repo
+    now_str: str
+    path: str
+    hosts: Union[str, list]
+    delete: bool
+    git_repo: bool
 
-    def to_json(self):
-        return json.dumps(self.__dict__)
+    def to_json(self) -> bytes:
+        """One log record as UTF-8 JSON bytes (orjson when installed)."""
+        if (orjson := optional_orjson()) is not None:
+            return orjson.dumps(self)
+        return json.dumps(asdict(self)).encode()
 
     @staticmethod
-    def from_json(json_str: str):
-        return LogItem(**json.loads(json_str))
+    def from_json(json_str: Union[str, bytes]):
+        orjson = optional_orjson()
+        loads = orjson.loads if orjson is not None else json.loads
+        return LogItem(**loads(json_str))
 
     def print(self):
         print(f"  {dim(self.now_str)}  {self.path} @ {format_hosts(self.hosts)}")
@@ -45,9 +45,26 @@ class Logger:
         self.log_file.touch(exist_ok=True)
 
     def read_last_sync_log(self) -> Optional[LogItem]:
-        with self.log_file.open("r", encoding="utf-8") as f:
-            lines = [line.strip() for line in f.readlines() if line.strip()]
-            return LogItem.from_json(lines[-1]) if lines else None
+        last = self._read_last_line()
+        return LogItem.from_json(last) if last else None
+
+    def _read_last_line(self) -> Optional[bytes]:
+        """Last non-empty line of the log, read backwards from EOF in doubling
+        blocks so the cost doesn't grow with the log's length."""
+        with self.log_file.open("rb") as f:
+            end = f.seek(0, os.SEEK_END)
+            window = 4096
+            while True:
+                start = max(0, end - window)
+                f.seek(start)
+                lines = f.read(end - start).split(b"\n")
+                # Unless the block reaches BOF, its first piece may be partial.
+                for line in reversed(lines if start == 0 else lines[1:]):
+                    if line.strip():
+                        return line.strip()
+                if start == 0:
+                    return None
+                window *= 2
 
     def print_last_log(self):
         last_log = self.read_last_sync_log()
@@ -67,5 +84,9 @@ class Logger:
         path = path.as_posix() if isinstance(path, Path) else path
         now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_item = LogItem(now_str, path, hosts, delete, git_repo)
-        with self.log_file.open("a", encoding="utf-8") as f:
-            f.write(log_item.to_json() + "\n")
+        # One O_APPEND write of the encoded line, no text-mode file wrapper.
+        fd = os.open(self.log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, log_item.to_json() + b"\n")
+        finally:
+            os.close(fd)
@@ -1,3 +1,5 @@
+import functools
+import os
 import subprocess
 from pathlib import Path
 
@@ -5,19 +7,29 @@ from my_toolbox.config import GIT_META_DIR_NAME, get_base_sync_dirs, get_sync_ro
 
 
 class SyncTree:
-    @property
+    def __init__(self):
+        # base repo -> (mtime_ns of its worktree registry, filtered entries).
+        # `git worktree add/remove/prune` touch .git/worktrees, so a matching
+        # mtime means the `git worktree list` spawn can be skipped.
+        self._wt_cache: dict[str, tuple[int, list[dict]]] = {}
+        self._git_repo_cache: dict[Path, bool] = {}
+
+    # The path/config properties below are fixed for one CLI invocation (env,
+    # RDEV_CONFIG, the worktree set), so each is resolved on first use only.
+
+    @functools.cached_property
     def sync_root(self) -> Path:
         return get_sync_root()
 
-    @property
+    @functools.cached_property
     def git_meta_dir(self) -> Path:
         return self.sync_root / GIT_META_DIR_NAME
 
-    @property
+    @functools.cached_property
     def base_dirs(self) -> list[str]:
         return get_base_sync_dirs()
 
-    @property
+    @functools.cached_property
     def sync_dirs(self) -> list[str]:
         base = self.base_dirs
         dirs = list(base)
@@ -30,14 +42,18 @@ class SyncTree:
 
         return dirs
 
-    @property
+    @functools.cached_property
     def repo_dirs(self) -> list[str]:
         root = self.sync_root
         return [d for d in self.sync_dirs if self.is_git_repo(root / d)]
 
-    @staticmethod
-    def is_git_repo(path: Path) -> bool:
-        return path.is_dir() and (path / ".git").exists()
+    def is_git_repo(self, path: Path) -> bool:
+        # One stat, cached: <path>/.git can only exist if path is a directory,
+        # and base repos are checked by both sync_dirs and repo_dirs.
+        hit = self._git_repo_cache.get(path)
+        if hit is None:
+            hit = self._git_repo_cache[path] = os.path.exists(path / ".git")
+        return hit
 
     # ------------------------------------------------------------------
     # Worktree discovery
@@ -53,32 +69,52 @@ class SyncTree:
             if not self.is_git_repo(repo_path):
                 continue
 
-            result = subprocess.run(
-                ["git", "worktree", "list", "--porcelain"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-            )
+            stamp = self._worktree_stamp(repo_path)
+            cached = self._wt_cache.get(repo)
+            if cached is not None and cached[0] == stamp:
+                if cached[1]:
+                    wt_map[repo] = cached[1]
+                continue
 
             entries: list[dict] = []
             current: dict = {}
-            for line in result.stdout.splitlines():
-                if line.startswith("worktree "):
-                    if current:
-                        entries.append(current)
-                    wt_path = Path(line.split(" ", 1)[1])
-                    current = {"name": wt_path.name}
-                elif line.startswith("HEAD "):
-                    current["head"] = line.split(" ", 1)[1][:8]
-                elif line.startswith("branch "):
-                    ref = line.split(" ", 1)[1]
-                    current["branch"] = ref.removeprefix("refs/heads/")
+            # Parse the porcelain output as it streams in, one line at a time.
+            with subprocess.Popen(
+                ["git", "worktree", "list", "--porcelain"],
+                cwd=repo_path,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            ) as proc:
+                for line in proc.stdout:
+                    line = line.rstrip("\n")
+                    if line.startswith("worktree "):
+                        if current:
+                            entries.append(current)
+                        wt_path = Path(line.split(" ", 1)[1])
+                        current = {"name": wt_path.name}
+                    elif line.startswith("HEAD "):
+                        current["head"] = line.split(" ", 1)[1][:8]
+                    elif line.startswith("branch "):
+                        ref = line.split(" ", 1)[1]
+                        current["branch"] = ref.removeprefix("refs/heads/")
 
             if current:
                 entries.append(current)
 
             entries = [e for e in entries if (root / e["name"]).is_dir()]
+            self._wt_cache[repo] = (stamp, entries)
             if entries:
                 wt_map[repo] = entries
 
         return wt_map
+
+    @staticmethod
+    def _worktree_stamp(repo_path: Path) -> int:
+        """mtime_ns of .git/worktrees, or of .git itself when there is none
+        (no linked worktrees yet, or .git is a gitfile)."""
+        git_dir = repo_path / ".git"
+        try:
+            return (git_dir / "worktrees").stat().st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            return git_dir.stat().st_mtime_ns
@@ -1,13 +1,18 @@
 """Container lifecycle over SSH. Lifecycle fns take ``Instance``; low-level
 helpers (_ssh_run, check_container, ...) stay string-typed (host + name)."""
 
+import codecs
+import hashlib
 import os
+import selectors
 import shlex
 import subprocess
 import sys
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional
+from pathlib import Path
+from typing import NoReturn, Optional
 
 from my_toolbox.rdev.topology import Instance
 from my_toolbox.ui import ScrollWindow
@@ -100,6 +105,24 @@ def _stream_to_window(
     return _stream_via_pipe(argv, desc=desc, stdin=stdin, height=height)
 
 
+def _terminate(proc: subprocess.Popen, grace: float = 3.0) -> None:
+    """Stop a streamed child on Ctrl-C / error: SIGTERM, then SIGKILL after
+    ``grace`` seconds; always reaped so no zombie ssh outlives us.
+
+    subprocess.run does this for its own child; the Popen-based stream paths
+    below must do it by hand, else an interrupted pull/setup leaves ssh running
+    (and still writing to our terminal) after the traceback.
+    """
+    if proc.poll() is not None:
+        return
+    proc.terminate()
+    try:
+        proc.wait(timeout=grace)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+
 def _stream_via_pipe(
     argv: list[str],
     *,
@@ -107,36 +130,57 @@ def _stream_via_pipe(
     stdin: Optional[str],
     height: int,
 ) -> int:
-    """Pipe capture: Popen(stdout=PIPE, stderr=STDOUT), read text chunks.
+    """Pipe capture: Popen(stdout=PIPE, stderr=STDOUT), read raw chunks.
 
-    If ``stdin`` (a script body) is given, write it to the child's stdin and
-    close that pipe BEFORE reading stdout -- else the child blocks on its stdin
-    while we block on its stdout (deadlock).
+    If ``stdin`` (a script body) is given, it is fed to the child through the
+    same selector that drains stdout, and that pipe is closed as soon as the
+    last byte is written. ``bash -s`` runs the script as it reads it: writing
+    the whole body up front would stall on a full stdout pipe (deadlock), and
+    no output would render until the body was fully written.
     """
-    # bufsize=1 is genuine line buffering only in text mode; text mode also
-    # avoids the RuntimeWarning that binary-mode bufsize=1 emits.
     proc = subprocess.Popen(
         argv,
         stdin=subprocess.PIPE if stdin else None,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        bufsize=1,
-        text=True,
-        encoding="utf-8",
-        errors="replace",
     )
-    if stdin:
-        assert proc.stdin is not None
-        proc.stdin.write(stdin)
-        proc.stdin.close()
-    with ScrollWindow(height=height, desc=desc) as win:
-        assert proc.stdout is not None
-        # Fixed-size chunk read (not `for line`) so \r progress redraws update
-        # live instead of buffering until a full line; read(64) returns as soon
-        # as any data is available, it does not wait for 64 bytes.
-        for chunk in iter(lambda: proc.stdout.read(64), ""):
-            if chunk:
-                win.write(chunk)
+    try:
+        with ScrollWindow(height=height, desc=desc) as win:
+            assert proc.stdout is not None
+            # os.read on the raw fd (not `for line`, not a text-mode read(n),
+            # which blocks until n chars or EOF) returns as soon as any output
+            # is available, so \r progress redraws update live. The incremental
+            # decoder keeps a UTF-8 char split across two reads intact.
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            sel = selectors.DefaultSelector()
+            sel.register(proc.stdout, selectors.EVENT_READ)
+            pending = memoryview(stdin.encode()) if stdin else None
+            if pending is not None:
+                assert proc.stdin is not None
+                os.set_blocking(proc.stdin.fileno(), False)
+                sel.register(proc.stdin, selectors.EVENT_WRITE)
+
+            while sel.get_map():
+                for key, _ in sel.select():
+                    if key.fileobj is proc.stdout:
+                        if chunk := os.read(key.fd, 4096):
+                            win.write(decoder.decode(chunk))
+                        else:
+                            sel.unregister(proc.stdout)
+                        continue
+                    try:
+                        pending = pending[os.write(key.fd, pending[:65536]) :]
+                    except BlockingIOError:
+                        continue
+                    except BrokenPipeError:
+                        pending = pending[:0]  # child stopped reading; rc says why
+                    if not pending:
+                        sel.unregister(proc.stdin)
+                        proc.stdin.close()
+            sel.close()
+    except BaseException:
+        _terminate(proc)
+        raise
     proc.wait()
     return proc.returncode
 
@@ -169,19 +213,23 @@ def _stream_via_pty(argv: list[str], *, desc: Optional[str], height: int) -> int
         close_fds=True,
     )
     os.close(slave_fd)  # child holds its copy; we read from master only
-    with ScrollWindow(height=height, desc=desc) as win:
-        try:
-            while True:
-                try:
-                    data = os.read(master_fd, 1024)
-                except OSError:
-                    # master closed (child exited) -> EIO on some platforms
-                    break
-                if not data:
-                    break
-                win.write(data.decode("utf-8", errors="replace"))
-        finally:
-            os.close(master_fd)
+    try:
+        with ScrollWindow(height=height, desc=desc) as win:
+            try:
+                while True:
+                    try:
+                        data = os.read(master_fd, 1024)
+                    except OSError:
+                        # master closed (child exited) -> EIO on some platforms
+                        break
+                    if not data:
+                        break
+                    win.write(data.decode("utf-8", errors="replace"))
+            finally:
+                os.close(master_fd)
+    except BaseException:
+        _terminate(proc)
+        raise
     return proc.wait()
 
 
@@ -218,27 +266,35 @@ class GpuInfo:
     procs: list  # list[GpuProc]
 
 
-# Remote script: query nvidia-smi GPUs, processes, and map PIDs to containers
+# Remote script: query nvidia-smi GPUs, processes, and map PIDs to containers.
+# Two nvidia-smi runs cover every GPU: the GPU query carries the uuid that the
+# compute-apps rows reference, and the container lookup reuses the apps rows.
+# One grep scans every PID's cgroup file (D|pid|cid); a single docker inspect
+# names every distinct container (N|cid|name); fetch_gpu_info does the join.
+# No unquoted $var word-splitting: the login shell may be zsh.
 _GPU_QUERY_SCRIPT = r"""
-nvidia-smi --query-gpu=index,utilization.gpu,memory.used,memory.total \
+nvidia-smi --query-gpu=index,uuid,utilization.gpu,memory.used,memory.total \
     --format=csv,noheader,nounits 2>/dev/null | awk '{print "G|" $0}'
-nvidia-smi --query-compute-apps=pid,gpu_uuid,used_memory \
-    --format=csv,noheader,nounits 2>/dev/null | awk '{print "P|" $0}'
-nvidia-smi --query-gpu=uuid,index --format=csv,noheader 2>/dev/null | awk '{print "U|" $0}'
-for pid in $(nvidia-smi --query-compute-apps=pid --format=csv,noheader 2>/dev/null); do
-    pid=$(echo "$pid" | tr -d ' ')
-    [ -z "$pid" ] && continue
-    cid=$(grep -azPo 'docker[-/]\K[0-9a-f]{64}' /proc/$pid/cgroup 2>/dev/null | head -c 64)
-    if [ -n "$cid" ]; then
-        name=$(docker inspect --format '{{.Name}}' "$cid" 2>/dev/null | sed 's|^/||')
-        echo "C|$pid|${name:--}"
-    else
-        echo "C|$pid|-"
-    fi
-done
+apps=$(nvidia-smi --query-compute-apps=pid,gpu_uuid,used_memory \
+    --format=csv,noheader,nounits 2>/dev/null)
+[ -z "$apps" ] && exit 0
+printf '%s\n' "$apps" | awk '{print "P|" $0}'
+hits=$(grep -aoPHm1 'docker[-/]\K[0-9a-f]{64}' \
+    $(printf '%s\n' "$apps" | awk -F', *' '{print "/proc/" $1 "/cgroup"}') \
+    2>/dev/null | awk -F'[/:]' '{print $3 "|" $5}')
+[ -z "$hits" ] && exit 0
+printf '%s\n' "$hits" | awk '{print "D|" $0}'
+printf '%s\n' "$hits" | cut -d'|' -f2 | sort -u \
+    | xargs -r docker inspect --format 'N|{{.Id}}|{{.Name}}' 2>/dev/null || true
 """
 
 
+def _nvsmi_int(field: str) -> int:
+    """int() for an nvidia-smi nounits field; "[N/A]" (MIG, some drivers)
+    counts as 0 so the GPU / process is still listed."""
+    return 0 if field in ("[N/A]", "N/A") else int(field)
+
+
 def fetch_gpu_info(host: str) -> Optional[list]:
     """Fetch GPU stats + per-GPU process/container info from a remote host.
 
@@ -252,7 +308,8 @@ def fetch_gpu_info(host: str) -> Optional[list]:
     uuid_to_idx: dict[str, int] = {}
     # proc_raw: list of (pid, gpu_uuid, mem_mb)
     proc_raw: list = []
-    pid_to_container: dict[int, str] = {}
+    pid_to_cid: dict[int, str] = {}
+    cid_to_name: dict[str, str] = {}
 
     for line in result.stdout.decode().splitlines():
         line = line.strip()
@@ -261,39 +318,43 @@ def fetch_gpu_info(host: str) -> Optional[list]:
         kind, _, rest = line.partition("|")
         parts = [p.strip() for p in rest.split(",")]
 
-        if kind == "G" and len(parts) == 4:
+        if kind == "G" and len(parts) == 5:
             try:
-                idx, util, used, total = (int(p) for p in parts)
-                gpus[idx] = GpuInfo(idx, util, used, total, [])
+                idx = int(parts[0])
             except ValueError:
                 continue
-        elif kind == "U" and len(parts) == 2:
-            uuid, idx_str = parts
+            uuid_to_idx[parts[1]] = idx
             try:
-                uuid_to_idx[uuid] = int(idx_str)
+                util, used, total = (_nvsmi_int(p) for p in parts[2:])
+                gpus[idx] = GpuInfo(idx, util, used, total, [])
             except ValueError:
                 continue
         elif kind == "P" and len(parts) == 3:
             try:
                 pid = int(parts[0])
                 uuid = parts[1]
-                mem = int(parts[2])
+                mem = _nvsmi_int(parts[2])
                 proc_raw.append((pid, uuid, mem))
             except ValueError:
                 continue
-        elif kind == "C":
-            c_parts = rest.split("|", 1)
-            if len(c_parts) == 2:
-                try:
-                    pid_to_container[int(c_parts[0])] = c_parts[1]
-                except ValueError:
-                    continue
+        elif kind == "D":
+            pid_str, _, cid = rest.partition("|")
+            try:
+                pid_to_cid[int(pid_str)] = cid
+            except ValueError:
+                continue
+        elif kind == "N":
+            cid, _, name = rest.partition("|")
+            cid_to_name[cid] = name.lstrip("/")
 
     for pid, uuid, mem in proc_raw:
         idx = uuid_to_idx.get(uuid)
         if idx is None or idx not in gpus:
             continue
-        container = pid_to_container.get(pid, "-")
+        cid = pid_to_cid.get(pid)
+        # In a container that docker couldn't name (gone since the grep):
+        # fall back to its short ID rather than claiming "no container".
+        container = (cid_to_name.get(cid) or cid[:12]) if cid else "-"
         gpus[idx].procs.append(GpuProc(container=container, mem_mb=mem))
 
     return [gpus[i] for i in sorted(gpus.keys())]
@@ -394,6 +455,27 @@ def inspect_container(host: str, container: str) -> ContainerInfo:
     return ContainerInfo(status=status, image=image, uptime=uptime)
 
 
+# Host-agnostic `docker run` flags, shared by every container we create.
+_DOCKER_RUN_FLAGS = (
+    "--gpus",
+    "all",
+    "--ipc=host",
+    "--pid=host",
+    "--network=host",
+    "--privileged",
+    "--ulimit",
+    "memlock=-1",
+    "--cap-add=SYS_PTRACE",
+    "--cap-add=SYS_ADMIN",
+    "-w",
+    "/root",
+    "-v",
+    "/dev/infiniband:/dev/infiniband",
+    "-v",
+    "/sys/class/infiniband:/sys/class/infiniband",
+)
+
+
 def create_container(instance: Instance) -> None:
     host = instance.ssh.alias
     spec = instance.container
@@ -407,37 +489,22 @@ def create_container(instance: Instance) -> None:
         "-itd",
         "--name",
         spec.name,
-        "--gpus",
-        "all",
         "--shm-size",
         spec.shm_size,
-        "--ipc=host",
-        "--pid=host",
-        "--network=host",
-        "--privileged",
-        "--ulimit",
-        "memlock=-1",
-        "--cap-add=SYS_PTRACE",
-        "--cap-add=SYS_ADMIN",
-        "-w",
-        "/root",
+        *_DOCKER_RUN_FLAGS,
         "-v",
         f"{host_root}:/host_root",
         "-v",
         f"{mirror_dir}:/mirror",
         "-v",
         f"{cache_dir}:/root/.cache",
-        "-v",
-        "/dev/infiniband:/dev/infiniband",
-        "-v",
-        "/sys/class/infiniband:/sys/class/infiniband",
         spec.image,
         "tail",
         "-f",
         "/dev/null",
     ]
 
-    cmd = " ".join(shlex.quote(p) for p in parts)
+    cmd = shlex.join(parts)
     print(f"  [{host}] creating container {spec.name}...")
     result = _ssh_run(host, cmd)
     if result.returncode != 0:
@@ -483,7 +550,31 @@ def _docker_action(instance: Instance, action: str, verb: str) -> None:
         raise RuntimeError(f"Failed to {action} on {host}: {stderr}")
 
 
-def _pull_image(host: str, image: str) -> None:
+# Local stamp per (host, image), touched after each successful pull. A fresh
+# stamp lets ensure_container skip the registry round-trip; recreate (the
+# "image drift" escape hatch) always pulls.
+PULL_STAMP_DIR = Path.home() / ".rdev" / "pull_stamps"
+PULL_STAMP_TTL = 6 * 3600
+
+
+def _pull_stamp(host: str, image: str) -> Path:
+    key = hashlib.sha1(f"{host}\0{image}".encode()).hexdigest()
+    return PULL_STAMP_DIR / key
+
+
+def _pull_image(host: str, image: str, *, reuse_recent: bool = False) -> None:
+    stamp = _pull_stamp(host, image)
+    if reuse_recent:
+        try:
+            age = time.time() - stamp.stat().st_mtime
+        except FileNotFoundError:
+            age = None
+        if age is not None and age < PULL_STAMP_TTL:
+            print(
+                f"  [{host}] {image} pulled {_format_duration(age)} ago, skipping pull"
+            )
+            return
+
     print(f"  [{host}] pulling {image}...")
     result = _ssh_run(
         host,
@@ -493,6 +584,8 @@ def _pull_image(host: str, image: str) -> None:
     )
     if result.returncode != 0:
         raise RuntimeError(f"Pull failed on {host}")
+    stamp.parent.mkdir(parents=True, exist_ok=True)
+    stamp.touch()
 
 
 def ensure_container(
@@ -515,7 +608,7 @@ def ensure_container(
     if skip_pull:
         print(f"  [{host}] --skip-pull: using local image {instance.container.image}")
     else:
-        _pull_image(host, instance.container.image)
+        _pull_image(host, instance.container.image, reuse_recent=True)
     create_container(instance)
     run_setup(instance)
     install_worktree(instance, worktree)
@@ -579,6 +672,17 @@ def recreate_container(
     install_worktree(instance, worktree)
 
 
+def _exec_ssh(*args: str) -> NoReturn:
+    """Replace this process with an interactive ``ssh -t`` session.
+
+    Nothing runs after an interactive shell, so exec instead of fork+wait:
+    no idle Python parent, and ssh gets the terminal (and signals) directly.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execvp("ssh", ["ssh", "-t", *args])
+
+
 def exec_in_container(
     host: str, container: str, command: str, *, interactive: bool = False
 ) -> int:
@@ -586,11 +690,10 @@ def exec_in_container(
 
     Returns the process exit code. Non-interactive runs render through a dim
     ScrollWindow (PTY-captured, so remote color/progress survive); interactive
-    shells get a full inherited TTY.
+    shells exec ssh in place of this process and never return.
     """
     if interactive:
-        docker_cmd = f"docker exec -it {shlex.quote(container)} zsh"
-        return subprocess.run(["ssh", "-t", host, docker_cmd]).returncode
+        _exec_ssh(host, f"docker exec -it {shlex.quote(container)} zsh")
 
     docker_cmd = f"docker exec {shlex.quote(container)} bash -c {shlex.quote(command)}"
     return _stream_to_window(
@@ -606,7 +709,7 @@ def exec_direct(host: str, command: str, *, interactive: bool = False) -> int:
     window/interactive split.
     """
     if interactive:
-        return subprocess.run(["ssh", "-t", host]).returncode
+        _exec_ssh(host)
 
     return _stream_to_window(
         ["ssh", "-t", host, f"bash -c {shlex.quote(command)}"],
@@ -615,7 +718,7 @@ def exec_direct(host: str, command: str, *, interactive: bool = False) -> int:
     )
 
 
-def attach_tmux_direct(host: str, session: str) -> None:
+def attach_tmux_direct(host: str, session: str) -> NoReturn:
     """Attach to (or create) a persistent tmux session over plain ssh.
 
     Uses rx's injected tmux (/opt/radixark/bin/tmux) to share the server
@@ -624,7 +727,7 @@ def attach_tmux_direct(host: str, session: str) -> None:
     rx_tmux = "/opt/radixark/bin/tmux"
     args = f"new-session -AD -s {shlex.quote(session)}"
     cmd = f"if [ -x {rx_tmux} ]; then exec {rx_tmux} {args}; else exec tmux {args}; fi"
-    subprocess.run(["ssh", "-t", host, cmd])
+    _exec_ssh(host, cmd)
 
 
 def _build_tmux_launch(
@@ -22,7 +22,7 @@ from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Optional
 
-import yaml
+from my_toolbox.config import yaml_safe_load
 
 
 @dataclass(frozen=True)
@@ -314,8 +314,8 @@ def load_topology(
     if not config_path.exists():
         raise FileNotFoundError(f"rdev config not found: {config_path}")
 
-    with open(config_path) as f:
-        raw = yaml.safe_load(f) or {}
+    with open(config_path, "rb") as f:
+        raw = yaml_safe_load(f) or {}
 
     defaults = raw.get("defaults", {})
     raw_clusters = raw.get("clusters", {})
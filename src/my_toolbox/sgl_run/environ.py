@@ -2,8 +2,6 @@
 
 import os
 
-import tabulate
-
 SGLANG_DEFAULT_ENVS: dict[str, str] = {
     "SGLANG_ALLOW_OVERWRITE_LONGER_CONTEXT_LEN": "1",
     "SGLANG_TORCH_PROFILER_DIR": "./",
@@ -20,15 +18,33 @@ SGLANG_DISPLAY_ENVS: list[tuple[str, str]] = [
 
 
 def set_default_envs():
-    for key, value in SGLANG_DEFAULT_ENVS.items():
-        os.environ.setdefault(key, value)
+    env = os.environ
+    env.update({k: v for k, v in SGLANG_DEFAULT_ENVS.items() if k not in env})
+
+
+def _fancy_grid(headers: tuple[str, str], rows: list[tuple[str, str]]) -> str:
+    """Two-column box-drawn table (tabulate's "fancy_grid" look)."""
+    key_w = max(len(r[0]) for r in (headers, *rows))
+    val_w = max(len(r[1]) for r in (headers, *rows))
+
+    def border(left: str, fill: str, mid: str, right: str) -> str:
+        return f"{left}{fill * (key_w + 2)}{mid}{fill * (val_w + 2)}{right}"
+
+    def line(key: str, val: str) -> str:
+        return f"│ {key:<{key_w}} │ {val:<{val_w}} │"
+
+    out = [border("╒", "═", "╤", "╕"), line(*headers), border("╞", "═", "╪", "╡")]
+    for i, row in enumerate(rows):
+        if i:
+            out.append(border("├", "─", "┼", "┤"))
+        out.append(line(*row))
+    out.append(border("╘", "═", "╧", "╛"))
+    return "\n".join(out)
 
 
 def print_launch_envs():
+    env = os.environ
     env_status = [
-        (name, os.getenv(name, default)) for name, default in SGLANG_DISPLAY_ENVS
+        (name, env.get(name, default)) for name, default in SGLANG_DISPLAY_ENVS
     ]
-    env_msg = tabulate.tabulate(
-        env_status, headers=["Variable", "Value"], tablefmt="fancy_grid"
-    )
-    print(env_msg)
+    print(_fancy_grid(("Variable", "Value"), env_status))
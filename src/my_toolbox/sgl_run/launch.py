@@ -1,31 +1,74 @@
 #!/usr/bin/env python3
+from __future__ import annotations
+
 import argparse
+import functools
 import os
-from typing import List
+import shlex
+import sys
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
 
 from my_toolbox.sgl_run.environ import print_launch_envs, set_default_envs
-from my_toolbox.sgl_run.models import MODEL_MAP, ModelInfo
-from my_toolbox.utils.list_ib_devices import get_active_ib_devices
+
+if TYPE_CHECKING:
+    from my_toolbox.sgl_run.models import ModelInfo
 
 DEFAULT_PORT = 23333
 DEFAULT_PREFILL_PORT = 25000
 DEFAULT_DECODE_PORT = 27000
 
 
+@functools.lru_cache(maxsize=1)
+def _active_ib_devices() -> List[str]:
+    """sysfs scan of IB ports; memoized so repeated builds in one process
+    (tests, bench drivers) don't rescan. Callers must not mutate the result.
+    """
+    # lazy: only prefill/decode launches probe IB; keep the sysfs scanner off
+    # the plain-server / router / --help startup path.
+    from my_toolbox.utils.list_ib_devices import get_active_ib_devices
+
+    return get_active_ib_devices()
+
+
+def _model_map() -> Dict[str, ModelInfo]:
+    # lazy: models pulls in dataclasses (+ inspect), about a third of this
+    # module's import time; router launches and a defaulted --model never
+    # touch it.
+    from my_toolbox.sgl_run.models import MODEL_MAP
+
+    return MODEL_MAP
+
+
+class _ModelChoices:
+    """``choices`` for --model backed by MODEL_MAP, loaded on first use.
+
+    argparse only consults choices to validate an explicit --model (a string
+    default isn't checked) or to render --help / an error message.
+    """
+
+    def __contains__(self, name: object) -> bool:
+        return name in _model_map()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_model_map())
+
+
 # --- Basic args ---
 
 
 def add_basic_args(parser: argparse.ArgumentParser):
     group = parser.add_argument_group("basic")
-    group.add_argument("--model", type=str, choices=MODEL_MAP.keys(), default="llama3")
+    group.add_argument("--model", type=str, choices=_ModelChoices(), default="llama3")
     group.add_argument("--host", type=str, default="0.0.0.0")
     group.add_argument("--port", type=int, default=None)
     group.add_argument("--chunk", type=int, default=None)
 
 
-def build_basic_args(args: argparse.Namespace, model_config: ModelInfo) -> List[str]:
-    result = ["--model", model_config.model_path]
-    result += ["--host", args.host]
+def build_basic_args(
+    args: argparse.Namespace, model_config: ModelInfo
+) -> Iterator[str]:
+    yield from model_config.model_args
+    yield from ("--host", args.host)
 
     if args.port is not None:
         port = args.port
@@ -35,12 +78,10 @@ def build_basic_args(args: argparse.Namespace, model_config: ModelInfo) -> List[
         port = DEFAULT_DECODE_PORT
     else:
         port = DEFAULT_PORT
-    result += ["--port", str(port)]
+    yield from ("--port", str(port))
 
     if args.chunk is not None:
-        result += ["--chunk", str(args.chunk)]
-
-    return result
+        yield from ("--chunk", str(args.chunk))
 
 
 # --- Speculative decoding args ---
@@ -56,34 +97,25 @@ def add_spec_args(parser: argparse.ArgumentParser):
     group.add_argument("--spec-tokens", type=int, default=None)
 
 
-def build_spec_args(args: argparse.Namespace, model_config: ModelInfo) -> List[str]:
+def build_spec_args(args: argparse.Namespace, model_config: ModelInfo) -> Iterator[str]:
     if args.spec_v2:
         os.environ["SGLANG_ENABLE_SPEC_V2"] = "1"
         args.spec = True
 
     if not args.spec:
-        return []
+        return
 
-    result = []
     spec_tokens = args.spec_tokens or (args.spec_steps + 1)
 
-    if args.spec_algo != "NGRAM" and model_config.draft_path is not None:
-        draft_path = model_config.draft_path
-        if isinstance(draft_path, dict):
-            if args.spec_algo not in draft_path:
-                raise ValueError(
-                    f"Speculative draft model for algorithm "
-                    f"{args.spec_algo} is not defined."
-                )
-            draft_path = draft_path[args.spec_algo]
-        result += ["--speculative-draft-model", str(draft_path)]
-
-    result += ["--speculative-algorithm", args.spec_algo]
-    result += ["--speculative-num-steps", str(args.spec_steps)]
-    result += ["--speculative-eagle-topk", str(args.spec_topk)]
-    result += ["--speculative-num-draft-tokens", str(spec_tokens)]
+    if args.spec_algo != "NGRAM":
+        draft_path = model_config.draft_for(args.spec_algo)
+        if draft_path is not None:
+            yield from ("--speculative-draft-model", draft_path)
 
-    return result
+    yield from ("--speculative-algorithm", args.spec_algo)
+    yield from ("--speculative-num-steps", str(args.spec_steps))
+    yield from ("--speculative-eagle-topk", str(args.spec_topk))
+    yield from ("--speculative-num-draft-tokens", str(spec_tokens))
 
 
 # --- Parallelism args ---
@@ -97,61 +129,61 @@ def add_parallelism_args(parser: argparse.ArgumentParser):
 
 def build_parallelism_args(
     args: argparse.Namespace, model_config: ModelInfo
-) -> List[str]:
+) -> Iterator[str]:
     if args.dp is not None:
-        return [
+        yield from (
             "--enable-dp-attention",
             "--enable-dp-lm-head",
             "--dp",
             str(args.dp),
             "--tp",
             str(args.dp),
-        ]
-
-    if args.tp is not None:
-        return ["--tp", str(args.tp)]
-    elif model_config.tp is not None:
-        return ["--tp", str(model_config.tp)]
-
-    return []
+        )
+    elif args.tp is not None:
+        yield from ("--tp", str(args.tp))
+    else:
+        yield from model_config.default_tp_args
 
 
 # --- Disaggregation args ---
 
 
-def add_disagg_args(parser: argparse.ArgumentParser):
-    group = parser.add_argument_group("disaggregation")
-
-    mode_group = group.add_mutually_exclusive_group()
+def add_mode_args(parser: argparse.ArgumentParser):
+    """The one registration of --prefill / --decode / --router."""
+    mode_group = parser.add_mutually_exclusive_group()
     mode_group.add_argument("--prefill", action="store_true")
     mode_group.add_argument("--decode", action="store_true")
     mode_group.add_argument("--router", action="store_true")
 
+
+def add_disagg_args(parser: argparse.ArgumentParser):
+    group = parser.add_argument_group("disaggregation")
+    add_mode_args(group)
+
     group.add_argument("--base-gpu", type=int, default=None)
     group.add_argument("--transfer", type=str, default="mooncake")
     group.add_argument("--ib", type=str, default=None)
 
 
-def build_disagg_args(args: argparse.Namespace, model_config: ModelInfo) -> List[str]:
+def build_disagg_args(
+    args: argparse.Namespace, model_config: ModelInfo
+) -> Iterator[str]:
     if not args.prefill and not args.decode:
-        return []
+        return
 
     mode = "prefill" if args.prefill else "decode"
-    result = [f"--disaggregation-mode={mode}"]
+    yield f"--disaggregation-mode={mode}"
 
     if args.base_gpu is not None:
-        result += ["--base-gpu-id", str(args.base_gpu)]
+        yield from ("--base-gpu-id", str(args.base_gpu))
 
-    result += ["--disaggregation-transfer-backend", args.transfer]
+    yield from ("--disaggregation-transfer-backend", args.transfer)
 
     # IB device: explicit value > auto-detect
     if args.ib is None:
-        devices = get_active_ib_devices()
+        devices = _active_ib_devices()
         if devices:
-            ib_device = devices[0]
-            result += ["--disaggregation-ib-device", ib_device]
-
-    return result
+            yield from ("--disaggregation-ib-device", devices[0])
 
 
 # --- Router args ---
@@ -194,56 +226,80 @@ def add_other_args(parser: argparse.ArgumentParser):
     group.add_argument("--log-requests", action="store_true")
 
 
-def build_other_args(args: argparse.Namespace, model_config: ModelInfo) -> List[str]:
-    result = []
-
+def build_other_args(
+    args: argparse.Namespace, model_config: ModelInfo
+) -> Iterator[str]:
     if args.attn is not None:
-        result += ["--attention-backend", args.attn]
+        yield from ("--attention-backend", args.attn)
 
-    if model_config.reasoning_parser is not None:
-        result += ["--reasoning-parser", model_config.reasoning_parser]
+    yield from model_config.reasoning_args
 
     if args.page_size is not None:
-        result += ["--page-size", str(args.page_size)]
+        yield from ("--page-size", str(args.page_size))
 
     if args.max_reqs is not None:
-        result += ["--max-running-requests", str(args.max_reqs)]
+        yield from ("--max-running-requests", str(args.max_reqs))
 
     if args.mem_frac is not None:
-        result += ["--mem-fraction-static", str(args.mem_frac)]
+        yield from ("--mem-fraction-static", str(args.mem_frac))
 
     if args.dtype is not None:
-        result += ["--dtype", args.dtype]
-    elif args.model in ["llama3"] and (args.spec or args.spec_v2):  # FIXME
-        result += ["--dtype", "float16"]
+        yield from ("--dtype", args.dtype)
+    elif args.model == "llama3" and (args.spec or args.spec_v2):  # FIXME
+        yield from ("--dtype", "float16")
 
     if args.no_cuda_graph:
-        result += ["--disable-cuda-graph"]
+        yield "--disable-cuda-graph"
 
     if args.no_radix:
-        result += ["--disable-radix-cache"]
+        yield "--disable-radix-cache"
 
     if args.log_interval is not None:
-        result += ["--decode-log-interval", str(args.log_interval)]
+        yield from ("--decode-log-interval", str(args.log_interval))
 
     if args.log_requests:
-        result += ["--log-requests", "--log-requests-level", "3"]
-
-    return result
+        yield from ("--log-requests", "--log-requests-level", "3")
 
 
 # --- Argument parser ---
 
 
-def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Launch SGLang server or router")
+@functools.lru_cache(maxsize=2)
+def _get_parser(router: bool) -> argparse.ArgumentParser:
+    """Build the parser once per mode; parse_args() never mutates it.
+
+    allow_abbrev=False: the mode was picked from an exact --router match, so
+    a prefix like --rout must not resolve to --router here either.
+    """
+    parser = argparse.ArgumentParser(
+        description="Launch SGLang server or router (pass --router for its options)",
+        allow_abbrev=False,
+    )
     add_basic_args(parser)
-    add_spec_args(parser)
-    add_parallelism_args(parser)
-    add_disagg_args(parser)
-    add_router_args(parser)
-    add_other_args(parser)
-    return parser.parse_args()
+    # Only register the groups the chosen launcher reads: the router needs
+    # just host/port + its own group, the server never reads the router group.
+    if router:
+        add_mode_args(parser.add_argument_group("disaggregation"))
+        add_router_args(parser)
+    else:
+        add_spec_args(parser)
+        add_parallelism_args(parser)
+        add_disagg_args(parser)
+        add_other_args(parser)
+    return parser
+
+
+@functools.lru_cache(maxsize=1)
+def _mode_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    add_mode_args(parser)
+    return parser
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    argv = sys.argv[1:] if argv is None else argv
+    mode, _ = _mode_parser().parse_known_args(argv)
+    return _get_parser(mode.router).parse_args(argv)
 
 
 # --- Launchers ---
@@ -254,17 +310,22 @@ class ServerLauncher:
 
     def __init__(self, args: argparse.Namespace):
         self.args = args
-        self.model_config = MODEL_MAP[args.model]
+        self.model_config = _model_map()[args.model]
 
     def build_cmd(self) -> List[str]:
         a, m = self.args, self.model_config
-        cmd = ["python3", "-m", "sglang.launch_server"]
-        cmd += build_basic_args(a, m)
-        cmd += build_spec_args(a, m)
-        cmd += build_parallelism_args(a, m)
-        cmd += build_disagg_args(a, m)
-        cmd += build_other_args(a, m)
-        return cmd
+        # One pass over the token generators. Order matters: build_spec_args
+        # sets args.spec for --spec-v2 before build_other_args reads it.
+        return [
+            "python3",
+            "-m",
+            "sglang.launch_server",
+            *build_basic_args(a, m),
+            *build_spec_args(a, m),
+            *build_parallelism_args(a, m),
+            *build_disagg_args(a, m),
+            *build_other_args(a, m),
+        ]
 
 
 class RouterLauncher:
@@ -288,7 +349,8 @@ def main():
     cmd = launcher.build_cmd()
     print_launch_envs()
 
-    print(f"command={' '.join(cmd)}")
+    # shlex.join: the printed command can be pasted back into a shell as-is.
+    print(f"command={shlex.join(cmd)}")
     os.execvp(cmd[0], cmd)
 
 
@@ -1,7 +1,8 @@
 """Model registry for SGLang launches."""
 
 import dataclasses
-from typing import Dict, Optional, Union
+import functools
+from typing import Dict, Mapping, Optional, Tuple, Union
 
 
 @dataclasses.dataclass
@@ -11,6 +12,45 @@ class ModelInfo:
     tp: Optional[int] = None
     reasoning_parser: Optional[str] = None
 
+    # Launch-argv fragments derived from the fixed fields above; computed once
+    # per model and spliced straight into the server command.
+
+    @functools.cached_property
+    def model_args(self) -> Tuple[str, ...]:
+        return ("--model", self.model_path)
+
+    @functools.cached_property
+    def reasoning_args(self) -> Tuple[str, ...]:
+        if self.reasoning_parser is None:
+            return ()
+        return ("--reasoning-parser", self.reasoning_parser)
+
+    @functools.cached_property
+    def default_tp_args(self) -> Tuple[str, ...]:
+        return () if self.tp is None else ("--tp", str(self.tp))
+
+    @functools.cached_property
+    def _drafts(self) -> Mapping[Optional[str], str]:
+        # draft_path normalized once: a plain path is keyed by None and serves
+        # every algorithm; a dict maps algorithm -> path.
+        if self.draft_path is None:
+            return {}
+        if isinstance(self.draft_path, str):
+            return {None: self.draft_path}
+        return self.draft_path
+
+    def draft_for(self, algo: str) -> Optional[str]:
+        """Draft model path for speculative ``algo``; None if the model has no
+        draft. Raises ValueError if per-algorithm drafts omit ``algo``."""
+        drafts = self._drafts
+        if None in drafts:
+            return drafts[None]
+        if drafts and algo not in drafts:
+            raise ValueError(
+                f"Speculative draft model for algorithm {algo} is not defined."
+            )
+        return drafts.get(algo)
+
 
 MODEL_MAP = {
     "llama2": ModelInfo(
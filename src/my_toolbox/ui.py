@@ -1,8 +1,9 @@
+import functools
 import shutil
 import sys
 import time
 from contextlib import contextmanager
-from typing import Optional, Union
+from typing import Callable, Optional, Union
 
 # Background colors
 red_block = lambda x: f"\x1b[41m{x}\x1b[0m"
@@ -35,6 +36,7 @@ def format_hosts(hosts: Union[str, list]) -> str:
     return cyan_text(raw)
 
 
+@functools.lru_cache(maxsize=64)
 def section_header(title: str, width: int = HEADER_WIDTH) -> str:
     """Render a section header like: ━━ Title ━━━━━━━━━━━━━━━━━━"""
     prefix = f"━━ {title} "
@@ -42,6 +44,7 @@ def section_header(title: str, width: int = HEADER_WIDTH) -> str:
     return bold(f"{prefix}{fill}")
 
 
+@functools.lru_cache(maxsize=64)
 def warn_banner(text: str) -> str:
     """Render a warning line like: ⚠  Delete mode enabled"""
     return bold_yellow(f"⚠  {text}")
@@ -65,18 +68,28 @@ class CursorTool:
         print("\x1b[%dD" % n, end="", flush=True)
 
     @staticmethod
-    def move_vertical(n: int):
+    def vertical_seq(n: int) -> str:
+        """Escape sequence moving n rows down (up if n < 0); "" for 0."""
         if n > 0:
-            CursorTool.move_down(n)
-        elif n < 0:
-            CursorTool.move_up(-n)
+            return "\x1b[%dB" % n
+        return "\x1b[%dA" % -n if n < 0 else ""
 
     @staticmethod
-    def move_horizontal(n: int):
+    def horizontal_seq(n: int) -> str:
+        """Escape sequence moving n columns right (left if n < 0); "" for 0."""
         if n > 0:
-            CursorTool.move_right(n)
-        elif n < 0:
-            CursorTool.move_left(-n)
+            return "\x1b[%dC" % n
+        return "\x1b[%dD" % -n if n < 0 else ""
+
+    @staticmethod
+    def move_vertical(n: int):
+        if n:
+            print(CursorTool.vertical_seq(n), end="", flush=True)
+
+    @staticmethod
+    def move_horizontal(n: int):
+        if n:
+            print(CursorTool.horizontal_seq(n), end="", flush=True)
 
     @staticmethod
     def reset_line():
@@ -110,27 +123,37 @@ class UITool:
         self.max_lines = max_lines
         self.cur_line = 0
         self.cur_col = 0
+        # Cursor moves + text of the update in progress; flush() emits them in
+        # one write, so an update costs one syscall instead of one per move.
+        self._frame: list[str] = []
         self.reset_pos()
+        self.flush()
 
         self.line_pos = [0] * max_lines
 
+    def flush(self):
+        if self._frame:
+            sys.stdout.write("".join(self._frame))
+            self._frame.clear()
+        sys.stdout.flush()
+
     def reset_pos(self):
         self.move_cursor(self.max_lines, 0)
 
     def move_cursor(self, line: Optional[int] = None, col: Optional[int] = None):
         if line is not None:
-            CursorTool.move_vertical(line - self.cur_line)
+            self._frame.append(CursorTool.vertical_seq(line - self.cur_line))
             self.cur_line = line
         if col is not None:
-            CursorTool.move_horizontal(col - self.cur_col)
+            self._frame.append(CursorTool.horizontal_seq(col - self.cur_col))
             self.cur_col = col
 
     def print_char(self, char: str):
-        print(char, end="", flush=True)
+        self._frame.append(char)
         self.cur_col += 1
 
     def print_line(self, content: str):
-        print(content, end="", flush=True)
+        self._frame.append(content)
         self.cur_col += len(content)
 
     def update_char(self, line: int, char: str):
@@ -144,6 +167,28 @@ class UITool:
             self.line_pos[line] = self.cur_col
 
         self.reset_pos()
+        self.flush()
+
+    def update_chars(
+        self, line: int, chars: str, style: Optional[Callable[[str], str]] = None
+    ):
+        """Batched ``update_char``: each run between \\r/\\n is styled as a
+        whole by ``style``, and the cursor returns to the bottom (and the frame
+        is flushed) once per call rather than once per char.
+        """
+        assert 0 <= line < self.max_lines
+
+        for k, run in enumerate(chars.replace("\r", "\n").split("\n")):
+            if k:
+                self.line_pos[line] = 0
+            if run:
+                self.move_cursor(line, self.line_pos[line])
+                self._frame.append(style(run) if style else run)
+                self.cur_col += len(run)
+                self.line_pos[line] = self.cur_col
+
+        self.reset_pos()
+        self.flush()
 
     def update_line(self, line: int, content: str):
         assert "\r" not in content and "\n" not in content
@@ -151,6 +196,7 @@ class UITool:
         self.move_cursor(line, 0)
         self.print_line(content)
         self.reset_pos()
+        self.flush()
 
     def print_desc(self, desc: str):
         header = section_header(desc)
@@ -4,16 +4,20 @@
 Transport modes:
   SSH:            bulk-sync host:/path /local
   SSH + Docker:   bulk-sync --src-container CTR host:/path /local
-  Both remote:    bulk-sync host1:/path host2:/path  (relays via local temp)
+  Both remote:    bulk-sync host1:/path host2:/path  (streams tar through here)
+                  bulk-sync --via-tmp host1:/path host2:/path  (resumable rsync
+                  relay via local temp)
 """
 
 import argparse
+import os
+import re
 import shlex
 import shutil
 import subprocess
 import sys
 from datetime import datetime
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 
 from my_toolbox.ui import (
     bold,
@@ -40,15 +44,26 @@ RSYNC_BASE = [
 
 BULK_SYNC_TMP = Path("/tmp/bulk_sync")
 
+# ssh transport for bulk transfers. Big copies are bound by the ssh cipher, so
+# offer the AES-GCM ciphers first (AES-NI/CLMUL-accelerated, typically ~2x
+# chacha20 on x86); it's a preference list, so a server lacking them still
+# negotiates one of the later entries instead of failing. ServerAliveInterval
+# keeps long inter-DC transfers from being dropped by idle-timeout middleboxes.
+RSH = (
+    "ssh -T -o Compression=no -o IPQoS=throughput -o ServerAliveInterval=30 "
+    "-c aes128-gcm@openssh.com,aes256-gcm@openssh.com,"
+    "chacha20-poly1305@openssh.com,aes128-ctr"
+)
+
 
 def _is_remote(path: str) -> bool:
     return ":" in path
 
 
-def _split_remote(path: str) -> tuple[str, str]:
-    """Split 'host:/path' into (host, path)."""
-    host, _, remote_path = path.partition(":")
-    return host, remote_path
+def _split_remote(path: str) -> tuple[str | None, str]:
+    """Split 'host:/path' into (host, path); a local path gives (None, path)."""
+    host, sep, remote_path = path.partition(":")
+    return (host, remote_path) if sep else (None, path)
 
 
 def _build_rsync_cmd(
@@ -60,20 +75,19 @@ def _build_rsync_cmd(
     """Build a single rsync command for a one-remote-at-most transfer."""
     cmd = list(RSYNC_BASE)
 
-    src_remote = _is_remote(src)
-    dst_remote = _is_remote(dst)
+    # One partition per path; host is None for a local path.
+    src_host, src_path = _split_remote(src)
+    dst_host, dst_path = _split_remote(dst)
     rsh: str | None = None
 
-    if src_container and src_remote:
-        host, path = _split_remote(src)
-        src = f"{src_container}:{path}"
-        rsh = f"ssh -T -o Compression=no {host} docker exec -i"
-    elif dst_container and dst_remote:
-        host, path = _split_remote(dst)
-        dst = f"{dst_container}:{path}"
-        rsh = f"ssh -T -o Compression=no {host} docker exec -i"
-    elif src_remote or dst_remote:
-        rsh = "ssh -T -o Compression=no"
+    if src_container and src_host is not None:
+        src = f"{src_container}:{src_path}"
+        rsh = f"{RSH} {src_host} docker exec -i"
+    elif dst_container and dst_host is not None:
+        dst = f"{dst_container}:{dst_path}"
+        rsh = f"{RSH} {dst_host} docker exec -i"
+    elif src_host is not None or dst_host is not None:
+        rsh = RSH
 
     if rsh:
         cmd += ["-e", rsh]
@@ -81,36 +95,172 @@ def _build_rsync_cmd(
     return cmd
 
 
+_DIM_ON, _DIM_OFF = b"\x1b[2m", b"\x1b[0m"
+# A line break followed by more text in the same chunk: indent that text.
+_BREAK_THEN_TEXT = re.compile(rb"([\r\n])(?=[^\r\n])")
+
+
+def _utf8_cut(buf: bytes) -> int:
+    """Index where a trailing, incomplete UTF-8 sequence starts in buf
+    (len(buf) when it ends on a character boundary)."""
+    n = len(buf)
+    # A sequence is at most 4 bytes: look back up to 3 bytes for its lead byte.
+    for i in range(1, min(4, n + 1)):
+        b = buf[n - i]
+        if b < 0x80:
+            return n
+        if b >= 0xC0:
+            need = 2 if b < 0xE0 else 3 if b < 0xF0 else 4
+            return n - i if i < need else n
+    return n
+
+
+def _relay_output(fd: int) -> None:
+    """Copy rsync's output to our stdout as raw chunks, dimmed and indented.
+
+    One os.read / write per chunk instead of a decode + format per line.
+    --info=progress2 rewrites its line with bare \\r, which now passes through
+    too, so progress updates in place instead of scrolling a line per tick.
+    A UTF-8 character (e.g. in a file name) split across two reads is held
+    back until it is complete, so the dim escapes never land inside it.
+    """
+    out = sys.stdout.buffer
+    sys.stdout.flush()
+    last = b"\n"
+    pending = b""
+    while True:
+        data = os.read(fd, 65536)
+        if data:
+            buf = pending + data
+            cut = _utf8_cut(buf)
+            chunk, pending = buf[:cut], buf[cut:]
+        else:
+            chunk, pending = pending, b""
+        if chunk:
+            body = _BREAK_THEN_TEXT.sub(rb"\1  ", chunk)
+            if last in (b"\r", b"\n") and chunk[:1] not in (b"\r", b"\n"):
+                body = b"  " + body
+            last = chunk[-1:]
+            out.write(_DIM_ON + body + _DIM_OFF)
+            out.flush()
+        if not data:
+            break
+    if last != b"\n":
+        # Don't let the next print land on a half-drawn progress line.
+        out.write(b"\n")
+        out.flush()
+
+
 def _run_rsync(cmd: list[str], label: str = "") -> int:
     header = f"Syncing {label}" if label else "Syncing"
     print(f"\n{section_header(header)}")
     print(f"  {dim('$ ' + shlex.join(cmd))}\n")
 
-    proc = subprocess.Popen(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-    )
-    for line in proc.stdout:
-        sys.stdout.write(f"  {dim(line.rstrip())}\n")
-        sys.stdout.flush()
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    _relay_output(proc.stdout.fileno())
     return proc.wait()
 
 
+def _remote_sh(host: str, container: str | None, script: str) -> list[str]:
+    """ssh argv running ``script`` under sh on host (inside container if set)."""
+    inner = ["sh", "-c", script]
+    if container:
+        inner = ["docker", "exec", "-i", container, *inner]
+    return [*shlex.split(RSH), host, shlex.join(inner)]
+
+
+def _build_stream_cmds(
+    src: str,
+    dst: str,
+    src_container: str | None = None,
+    dst_container: str | None = None,
+) -> tuple[list[str], list[str]]:
+    """(pack, unpack) argvs for a remote -> remote tar stream.
+
+    Mirrors rsync's trailing-slash rule on src: ``/a/b/`` sends b's contents,
+    ``/a/b`` sends b itself. dst is always a directory (created if missing);
+    extracted files get the destination user's ownership and umask, as with
+    the rsync modes.
+    """
+    src_host, src_path = _split_remote(src)
+    dst_host, dst_path = _split_remote(dst)
+    if src_path.endswith("/"):
+        tar_dir, member = src_path, "."
+    else:
+        p = PurePosixPath(src_path)
+        tar_dir, member = str(p.parent), p.name
+    q = shlex.quote
+    pack = f"tar -C {q(tar_dir)} -cf - {q(member)}"
+    # Match RSYNC_BASE's --no-owner/--no-group/--no-perms: as root (e.g. under
+    # docker exec) plain tar -x would keep the source uid/gid and mode bits.
+    unpack = (
+        f"mkdir -p {q(dst_path)} && tar -C {q(dst_path)} "
+        "--no-same-owner --no-same-permissions -xf -"
+    )
+    return (
+        _remote_sh(src_host, src_container, pack),
+        _remote_sh(dst_host, dst_container, unpack),
+    )
+
+
+def _run_stream(pack_cmd: list[str], unpack_cmd: list[str]) -> int:
+    """Pipe pack's stdout straight into unpack's stdin: bytes move through a
+    kernel pipe (no local disk, no Python copy), and reading the source
+    overlaps writing the destination. Returns unpack's exit code if non-zero
+    (its death SIGPIPEs pack, which would mask the real error), else pack's."""
+    print(f"\n{section_header('Streaming')}")
+    print(f"  {dim('$ ' + shlex.join(pack_cmd))}")
+    print(f"  {dim('| ' + shlex.join(unpack_cmd))}\n")
+
+    pack = subprocess.Popen(pack_cmd, stdout=subprocess.PIPE)
+    unpack = subprocess.Popen(unpack_cmd, stdin=pack.stdout)
+    # Drop our copy of the read end so pack sees SIGPIPE if unpack dies.
+    pack.stdout.close()
+    rc_unpack = unpack.wait()
+    rc_pack = pack.wait()
+    return rc_unpack or rc_pack
+
+
+def _remove_tree(path: Path):
+    """rm -rf path. coreutils rm walks with fts + unlinkat and beats
+    shutil.rmtree's per-entry Python loop on relay dirs with many small files;
+    fall back to rmtree where rm is unavailable or fails, which raises OSError
+    if the tree still can't be removed (e.g. root-owned leftovers)."""
+    if rm := shutil.which("rm"):
+        if subprocess.run([rm, "-rf", "--", str(path)]).returncode == 0:
+            return
+    shutil.rmtree(path)
+
+
 def _prepare_tmp():
     """Clean up stale tmp from previous interrupted runs, then create fresh."""
     if BULK_SYNC_TMP.exists():
-        shutil.rmtree(BULK_SYNC_TMP)
+        try:
+            _remove_tree(BULK_SYNC_TMP)
+        except OSError as e:
+            print(
+                f"{red_text('✗')} Cannot remove stale tmp {BULK_SYNC_TMP}: {e}",
+                file=sys.stderr,
+            )
+            sys.exit(1)
         print(f"{green_text('✓')} Cleaned up stale tmp: {BULK_SYNC_TMP}")
     BULK_SYNC_TMP.mkdir(parents=True)
     print(f"{green_text('✓')} Created tmp: {BULK_SYNC_TMP}")
 
 
 def _cleanup_tmp():
-    if BULK_SYNC_TMP.exists():
-        shutil.rmtree(BULK_SYNC_TMP, ignore_errors=True)
-        print(f"\n{green_text('✓')} Cleaned up tmp: {BULK_SYNC_TMP}")
+    if not BULK_SYNC_TMP.exists():
+        return
+    # Runs in a finally: warn instead of raising over the transfer's own exit.
+    try:
+        _remove_tree(BULK_SYNC_TMP)
+    except OSError as e:
+        print(
+            f"\n{warn_banner(f'Could not remove tmp {BULK_SYNC_TMP}: {e}')}",
+            file=sys.stderr,
+        )
+        return
+    print(f"\n{green_text('✓')} Cleaned up tmp: {BULK_SYNC_TMP}")
 
 
 def _print_plan(
@@ -119,6 +269,7 @@ def _print_plan(
     src_container: str | None,
     dst_container: str | None,
     relay: bool,
+    via_tmp: bool = False,
 ):
     print(section_header("Bulk Sync"))
     print(f"  Source:  {bold(src)}")
@@ -131,7 +282,12 @@ def _print_plan(
         host, _ = _split_remote(dst)
         print(f"  Docker:  {cyan_text(dst_container)} (dst @ {cyan_text(host)})")
 
-    if relay:
+    if relay and not via_tmp:
+        print(
+            f"\n{warn_banner('Streaming tar through local pipe (both sides remote)')}"
+        )
+        print(f"  Note:    {dim('not resumable; use --via-tmp for rsync --partial')}")
+    elif relay:
         print(f"\n{warn_banner('Relaying via local temp (both sides remote)')}")
         print(f"  Tmp:     {dim(str(BULK_SYNC_TMP))}")
         src_host = _split_remote(src)[0]
@@ -164,6 +320,12 @@ def main():
         metavar="CONTAINER",
         help="Docker container on the destination host (requires rsync in container)",
     )
+    parser.add_argument(
+        "--via-tmp",
+        action="store_true",
+        help="Both-remote only: relay with two resumable rsyncs through a local "
+        "temp dir instead of streaming tar host-to-host",
+    )
     args = parser.parse_args()
 
     src_remote = _is_remote(args.src)
@@ -175,10 +337,31 @@ def main():
         parser.error("--dst-container requires dst to be remote (host:/path)")
 
     relay = src_remote and dst_remote
-    _print_plan(args.src, args.dst, args.src_container, args.dst_container, relay)
+    if args.via_tmp and not relay:
+        parser.error("--via-tmp only applies when both src and dst are remote")
+    _print_plan(
+        args.src,
+        args.dst,
+        args.src_container,
+        args.dst_container,
+        relay,
+        via_tmp=args.via_tmp,
+    )
     input(dim("\n  ⏎  Press Enter to continue..."))
 
-    if relay:
+    if relay and not args.via_tmp:
+        rc = _run_stream(
+            *_build_stream_cmds(
+                args.src,
+                args.dst,
+                src_container=args.src_container,
+                dst_container=args.dst_container,
+            )
+        )
+        if rc != 0:
+            _fail(rc, "Stream (src | dst)")
+            sys.exit(rc)
+    elif relay:
         tmpdir = str(BULK_SYNC_TMP)
         _prepare_tmp()
         try:
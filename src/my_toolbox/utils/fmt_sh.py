@@ -9,50 +9,40 @@ import argparse
 import re
 import sys
 
-ENV_VAR_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*=")
+# A token is a run of unquoted non-space chars and quoted spans glued together
+# (so --flag="a b" stays whole); an unterminated quote runs to end of line.
+_TOKEN_FINDALL = re.compile(r"""(?:[^ "']+|"[^"]*"?|'[^']*'?)+""").findall
+# Same tokens, but never across a newline; a bare "\n" token marks each line
+# end so format_script can tokenize a whole script in one scan.
+_SCRIPT_TOKEN_FINDALL = re.compile(
+    r"""(?:[^ \n"']+|"[^"\n]*"?|'[^'\n]*'?)+|\n"""
+).findall
 
 
 def tokenize(line: str) -> list[str]:
     """Split a shell line into tokens, respecting quoted strings."""
-    tokens: list[str] = []
-    current: list[str] = []
-    quote_char = None
-
-    for ch in line:
-        if quote_char:
-            current.append(ch)
-            if ch == quote_char:
-                quote_char = None
-        elif ch in ('"', "'"):
-            current.append(ch)
-            quote_char = ch
-        elif ch == " ":
-            if current:
-                tokens.append("".join(current))
-                current = []
-        else:
-            current.append(ch)
-
-    if current:
-        tokens.append("".join(current))
-
-    return tokens
-
+    return _TOKEN_FINDALL(line)
 
-def extract_env_vars(tokens: list[str]) -> tuple[list[str], list[str]]:
-    """Split tokens into leading KEY=VALUE env vars and the rest."""
-    for i, tok in enumerate(tokens):
-        if not ENV_VAR_RE.match(tok):
-            return tokens[:i], tokens[i:]
-    return tokens, []
 
-
-def split_args(tokens: list[str]) -> tuple[list[str], list[list[str]]]:
-    """Split tokens into command prefix and --argument groups."""
+def split_command(
+    tokens: list[str],
+) -> tuple[list[str], list[str], list[list[str]]]:
+    """Split tokens into leading KEY=VALUE env vars, the command prefix and
+    --argument groups, in one pass."""
+    env_vars: list[str] = []
     cmd_parts: list[str] = []
     arg_groups: list[list[str]] = []
+    in_env = True
 
     for tok in tokens:
+        if in_env:
+            # KEY=VALUE with an ASCII identifier KEY; C string methods beat a
+            # regex match per token (isascii: isidentifier allows Unicode).
+            eq = tok.find("=")
+            if eq > 0 and (key := tok[:eq]).isascii() and key.isidentifier():
+                env_vars.append(tok)
+                continue
+            in_env = False
         if tok.startswith("--"):
             arg_groups.append([tok])
         elif arg_groups:
@@ -60,7 +50,7 @@ def split_args(tokens: list[str]) -> tuple[list[str], list[list[str]]]:
         else:
             cmd_parts.append(tok)
 
-    return cmd_parts, arg_groups
+    return env_vars, cmd_parts, arg_groups
 
 
 def format_command(line: str, indent: int = 2) -> str:
@@ -68,15 +58,16 @@ def format_command(line: str, indent: int = 2) -> str:
     line = line.strip().replace("\\\n", " ")
     if not line:
         return ""
+    return _format_tokens(tokenize(line), indent)
+
 
-    tokens = tokenize(line)
-    env_vars, rest = extract_env_vars(tokens)
+def _format_tokens(tokens: list[str], indent: int) -> str:
+    env_vars, cmd_parts, arg_groups = split_command(tokens)
     exports = [f"export {v}" for v in env_vars]
 
-    if not rest:
+    if len(env_vars) == len(tokens):
         return "\n".join(exports) + "\n"
 
-    cmd_parts, arg_groups = split_args(rest)
     pad = " " * indent
     arg_lines = [pad + " ".join(g) for g in arg_groups]
     command = " \\\n".join([" ".join(cmd_parts)] + arg_lines)
@@ -88,26 +79,41 @@ def format_command(line: str, indent: int = 2) -> str:
 
 def format_script(text: str, indent: int = 2) -> str:
     """Format each command line in a shell script."""
+    lines = text.splitlines()
+    cmds = {
+        i: stripped
+        for i, line in enumerate(lines)
+        if (stripped := line.strip()) and not stripped.startswith("#")
+    }
+    stream = _SCRIPT_TOKEN_FINDALL("".join(f"{c}\n" for c in cmds.values()))
+
+    out = lines[:]
+    it = iter(cmds)
+    tokens: list[str] = []
+    for tok in stream:
+        if tok == "\n":
+            out[next(it)] = _format_tokens(tokens, indent).rstrip("\n")
+            tokens = []
+        else:
+            tokens.append(tok)
+    return "\n".join(out) + "\n"
 
-    def fmt(line: str) -> str:
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            return line
-        return format_command(line, indent=indent).rstrip("\n")
 
-    return "\n".join(fmt(line) for line in text.splitlines()) + "\n"
+# Whole-file bytes I/O with one decode/encode instead of TextIOWrapper's
+# per-chunk decoding; surrogateescape round-trips any non-UTF-8 bytes.
+_ENCODING, _ERRORS = "utf-8", "surrogateescape"
 
 
 def read_input(args) -> str:
     if args.file:
-        with open(args.file) as f:
-            return f.read()
+        with open(args.file, "rb") as f:
+            return f.read().decode(_ENCODING, _ERRORS)
 
     if args.write:
         print("error: --write requires a file argument", file=sys.stderr)
         sys.exit(1)
 
-    return sys.stdin.read()
+    return sys.stdin.buffer.read().decode(_ENCODING, _ERRORS)
 
 
 def main():
@@ -129,11 +135,12 @@ def main():
     output = format_script(text, indent=args.indent)
 
     if args.write:
-        with open(args.file, "w") as f:
-            f.write(output)
+        with open(args.file, "wb") as f:
+            f.write(output.encode(_ENCODING, _ERRORS))
         print(f"Formatted {args.file}", file=sys.stderr)
     else:
-        sys.stdout.write(output)
+        sys.stdout.buffer.write(output.encode(_ENCODING, _ERRORS))
+        sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -1,69 +1,89 @@
 #!/usr/bin/env python3
 """List InfiniBand devices and their link state."""
 
-from pathlib import Path
-from typing import List
+import os
+from typing import List, Tuple
 
-IB_SYSFS = Path("/sys/class/infiniband")
+IB_SYSFS = "/sys/class/infiniband"
 
 
-def _read_port_state(port_path: Path) -> str:
+def _read_small(path: str) -> bytes:
+    """One open/read/close for a tiny sysfs attribute (no buffered file)."""
+    fd = os.open(path, os.O_RDONLY)
     try:
-        return (port_path / "state").read_text().strip()
+        return os.read(fd, 64)
+    finally:
+        os.close(fd)
+
+
+def _read_port_state(port_path: str) -> bytes:
+    try:
+        return _read_small(f"{port_path}/state").strip()
     except OSError:
-        return "unknown"
+        return b"unknown"
 
 
-def _read_port_rate(port_path: Path) -> int:
+def _read_port_rate(port_path: str) -> int:
     """Return link rate in Gbps, or -1 on failure."""
     try:
-        return int((port_path / "rate").read_text().split()[0])
+        return int(_read_small(f"{port_path}/rate").split()[0])
     except (OSError, ValueError, IndexError):
         return -1
 
 
-def get_active_ib_devices() -> List[str]:
-    """Return names of active, high-speed, non-Ethernet IB devices."""
-    if not IB_SYSFS.exists():
+def _probe(dev: os.DirEntry) -> Tuple[str, bytes, int]:
+    # A missing port dir reads as state "unknown" / rate -1.
+    port_path = f"{dev.path}/ports/1"
+    return dev.name, _read_port_state(port_path), _read_port_rate(port_path)
+
+
+def _scan() -> List[Tuple[str, bytes, int]]:
+    """(name, state, rate) per IB device, sorted by name; [] without IB sysfs.
+
+    One directory walk and one set of sysfs reads, shared by the getter and
+    the CLI printer.
+    """
+    try:
+        with os.scandir(IB_SYSFS) as it:
+            devs = sorted(it, key=lambda e: e.name)
+    except OSError:
         return []
+    if len(devs) <= 1:
+        return [_probe(d) for d in devs]
 
-    devices = []
-    for dev in sorted(IB_SYSFS.iterdir()):
-        if "eth" in dev.name.lower():
-            continue
+    # lazy: the pool is only worth its import on multi-NIC hosts.
+    from concurrent.futures import ThreadPoolExecutor
 
-        port_path = dev / "ports" / "1"
-        if not port_path.is_dir():
-            continue
+    # Port attributes are driver-backed (mlx5 may query firmware), and the
+    # reads release the GIL, so probe devices concurrently; map keeps order.
+    with ThreadPoolExecutor(max_workers=min(32, len(devs))) as pool:
+        return list(pool.map(_probe, devs))
 
-        state = _read_port_state(port_path)
-        if "ACTIVE" not in state.upper():
-            continue
 
-        # Filter low-speed devices (< 100 Gbps)
-        rate = _read_port_rate(port_path)
-        if 0 <= rate < 100:
-            continue
+def _is_active_high_speed(name: str, state: bytes, rate: int) -> bool:
+    if "eth" in name.lower() or b"ACTIVE" not in state.upper():
+        return False
+    # Filter low-speed devices (< 100 Gbps)
+    return not 0 <= rate < 100
 
-        devices.append(dev.name)
 
-    return devices
+def get_active_ib_devices() -> List[str]:
+    """Return names of active, high-speed, non-Ethernet IB devices."""
+    return [dev[0] for dev in _scan() if _is_active_high_speed(*dev)]
 
 
 def list_ib_devices():
     """Print IB device status (CLI entry point)."""
-    if not IB_SYSFS.exists():
+    if not os.path.isdir(IB_SYSFS):
         print("No InfiniBand sysfs found.")
         return
 
-    active = set(get_active_ib_devices())
-    for dev in sorted(IB_SYSFS.iterdir()):
-        state = _read_port_state(dev / "ports" / "1")
-        if dev.name in active:
+    for name, state, rate in _scan():
+        if _is_active_high_speed(name, state, rate):
             label = "ACTIVE (high-speed)"
         else:
-            label = f"NOT active (state={state})"
-        print(f"{dev.name} is {label}")
+            label = f"NOT active (state={state.decode(errors='replace')})"
+        print(f"{name} is {label}")
 
 
 def main():
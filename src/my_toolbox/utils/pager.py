@@ -10,24 +10,43 @@ import sys
 DEFAULT_PAGER = "less -FRX"
 
 
-def page(content: str) -> None:
+# Feed the pager in slices so a multi-MB diff is never encoded (or buffered
+# in the pipe writer) as one whole extra copy.
+_CHUNK = 64 * 1024
+
+
+def page(content: str | bytes) -> None:
     """Display *content* through a pager, like ``git log`` does.
 
     Respects the PAGER environment variable. Falls back to direct
-    stdout when not a TTY.
+    stdout when not a TTY. ``bytes`` content is passed through undecoded.
     """
     if not sys.stdout.isatty():
-        sys.stdout.write(content)
+        if isinstance(content, bytes):
+            sys.stdout.flush()
+            sys.stdout.buffer.write(content)
+        else:
+            sys.stdout.write(content)
         return
 
     pager_cmd = os.environ.get("PAGER", DEFAULT_PAGER)
     try:
-        proc = subprocess.Popen(
-            pager_cmd,
-            shell=True,
-            stdin=subprocess.PIPE,
-            encoding="utf-8",
-        )
-        proc.communicate(input=content)
-    except (OSError, BrokenPipeError):
-        sys.stdout.write(content)
+        proc = subprocess.Popen(pager_cmd, shell=True, stdin=subprocess.PIPE)
+    except OSError:
+        sys.stdout.write(content if isinstance(content, str) else content.decode())
+        return
+
+    assert proc.stdin is not None
+    try:
+        for i in range(0, len(content), _CHUNK):
+            chunk = content[i : i + _CHUNK]
+            proc.stdin.write(chunk.encode() if isinstance(chunk, str) else chunk)
+        proc.stdin.close()
+    except BrokenPipeError:
+        # User quit the pager early; the rest is unwanted. Closing drops any
+        # still-buffered bytes (raising again) but releases the fd.
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+    proc.wait()
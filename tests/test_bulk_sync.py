@@ -0,0 +1,132 @@
+"""Tests for bulk-sync's remote -> remote tar stream and relay tmp handling."""
+
+import shlex
+
+import pytest
+
+from my_toolbox.utils import bulk_sync
+from my_toolbox.utils.bulk_sync import (
+    RSH,
+    _build_rsync_cmd,
+    _build_stream_cmds,
+    _run_stream,
+)
+
+_SSH = shlex.split(RSH)
+
+
+def _remote(cmd):
+    """Split an ssh argv into (host, remote argv)."""
+    assert cmd[: len(_SSH)] == _SSH
+    host, remote = cmd[len(_SSH) :]
+    return host, shlex.split(remote)
+
+
+@pytest.mark.parametrize(
+    "src, dst, kwargs",
+    [
+        ("/a/", "/b", {}),
+        ("h1:/a/", "/tmp/x", {"src_container": "c1"}),
+        ("/tmp/x/", "h2:/b", {"dst_container": "c2"}),
+    ],
+)
+def test_rsync_cmd_keeps_resume_flags_compatible(src, dst, kwargs):
+    # rsync rejects --append(-verify) together with --whole-file at option
+    # parsing, before anything is transferred.
+    cmd = _build_rsync_cmd(src, dst, **kwargs)
+    has_append = any(a in ("--append", "--append-verify") for a in cmd)
+    assert not (has_append and ("--whole-file" in cmd or "-W" in cmd))
+
+
+class TestBuildStreamCmds:
+    def test_trailing_slash_sends_contents(self):
+        pack, unpack = _build_stream_cmds("h1:/a/b/", "h2:/x y")
+        assert _remote(pack) == ("h1", ["sh", "-c", "tar -C /a/b/ -cf - ."])
+        host, (sh, c, script) = _remote(unpack)
+        assert (host, sh, c) == ("h2", "sh", "-c")
+        assert script.startswith("mkdir -p '/x y' && tar -C '/x y' ")
+        assert "--no-same-owner --no-same-permissions -xf -" in script
+
+    def test_no_trailing_slash_sends_dir_itself(self):
+        pack, _ = _build_stream_cmds("h1:/a/b", "h2:/x")
+        assert _remote(pack) == ("h1", ["sh", "-c", "tar -C /a -cf - b"])
+
+    def test_container_wrapping(self):
+        pack, unpack = _build_stream_cmds(
+            "h1:/a/", "h2:/x", src_container="c1", dst_container="c2"
+        )
+        assert _remote(pack)[1][:4] == ["docker", "exec", "-i", "c1"]
+        assert _remote(unpack)[1][:6] == ["docker", "exec", "-i", "c2", "sh", "-c"]
+
+
+class TestRunStream:
+    def test_unpack_failure_wins_over_pack_sigpipe(self):
+        # unpack dies first; pack then gets SIGPIPE (-13), which must not mask 3.
+        assert _run_stream(["yes"], ["sh", "-c", "exit 3"]) == 3
+
+    def test_pack_failure(self):
+        assert _run_stream(["sh", "-c", "exit 2"], ["cat"]) == 2
+
+    def test_success(self):
+        assert _run_stream(["echo", "hi"], ["cat"]) == 0
+
+
+class TestRelayTmp:
+    @pytest.fixture
+    def tmp_dir(self, tmp_path, monkeypatch):
+        path = tmp_path / "bulk_sync"
+        monkeypatch.setattr(bulk_sync, "BULK_SYNC_TMP", path)
+        return path
+
+    def test_remove_tree_raises_when_fallback_fails(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(bulk_sync.shutil, "which", lambda _: None)
+        not_a_dir = tmp_path / "f"
+        not_a_dir.write_text("x")
+        with pytest.raises(OSError):
+            bulk_sync._remove_tree(not_a_dir)
+
+    def test_prepare_replaces_stale_tmp(self, tmp_dir):
+        (tmp_dir / "old").mkdir(parents=True)
+        bulk_sync._prepare_tmp()
+        assert tmp_dir.is_dir() and not any(tmp_dir.iterdir())
+
+    def test_prepare_exits_when_stale_tmp_stays(self, tmp_dir, monkeypatch, capsys):
+        tmp_dir.mkdir()
+        monkeypatch.setattr(bulk_sync, "_remove_tree", _raise_permission)
+        with pytest.raises(SystemExit):
+            bulk_sync._prepare_tmp()
+        assert "Cannot remove stale tmp" in capsys.readouterr().err
+
+    def test_cleanup_warns_instead_of_claiming_success(
+        self, tmp_dir, monkeypatch, capsys
+    ):
+        tmp_dir.mkdir()
+        monkeypatch.setattr(bulk_sync, "_remove_tree", _raise_permission)
+        bulk_sync._cleanup_tmp()
+        out = capsys.readouterr()
+        assert "Could not remove tmp" in out.err
+        assert "Cleaned up" not in out.out
+
+
+def _raise_permission(path):
+    raise PermissionError(13, "Permission denied", str(path))
+
+
+class TestRelayOutput:
+    def test_utf8_cut(self):
+        e = "é".encode()  # 2 bytes
+        assert bulk_sync._utf8_cut(b"ab") == 2
+        assert bulk_sync._utf8_cut(b"a" + e) == 3
+        assert bulk_sync._utf8_cut(b"a" + e[:1]) == 1
+        assert bulk_sync._utf8_cut(b"a" + "文".encode()[:2]) == 1
+        assert bulk_sync._utf8_cut(b"") == 0
+
+    def test_split_char_is_not_broken_by_escapes(self, monkeypatch, capsysbinary):
+        name = "数据.bin\n".encode()
+        reads = iter([name[:2], name[2:], b""])
+        monkeypatch.setattr(bulk_sync.os, "read", lambda fd, n: next(reads))
+        bulk_sync._relay_output(0)
+        out = capsysbinary.readouterr().out
+        plain = out.replace(bulk_sync._DIM_ON, b"").replace(bulk_sync._DIM_OFF, b"")
+        assert plain == b"  " + name
+        assert "数据".encode() in out
@@ -0,0 +1,27 @@
+"""Tests for fmt-sh tokenizing and formatting."""
+
+from my_toolbox.utils.fmt_sh import format_command, format_script, tokenize
+
+
+class TestTokenize:
+    def test_plain(self):
+        assert tokenize("  python3  -m x ") == ["python3", "-m", "x"]
+
+    def test_quotes_glue_to_token(self):
+        # Quoted spans keep their quotes and join adjacent unquoted text.
+        assert tokenize("""--a="x y" 'p q'r""") == ['--a="x y"', "'p q'r"]
+
+    def test_unterminated_quote_runs_to_end(self):
+        assert tokenize('a "b c') == ["a", '"b c']
+
+
+def test_format_command():
+    out = format_command("A=1 python3 -m sglang --tp 2 --name 'a b'")
+    assert out == ("export A=1\n\npython3 -m sglang \\\n  --tp 2 \\\n  --name 'a b'\n")
+
+
+def test_format_script_keeps_comments_and_blanks():
+    text = "# c\n\nA=1 run --x 'a\nb --y\n"
+    assert format_script(text) == (
+        "# c\n\nexport A=1\n\nrun \\\n  --x 'a\nb \\\n  --y\n"
+    )
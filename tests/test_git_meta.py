@@ -0,0 +1,97 @@
+"""Tests for the git metadata reader and cwd -> repo detection."""
+
+from pathlib import Path
+
+import pytest
+
+from my_toolbox.git.git_meta import GitMetaReader, detect_repo_from_cwd
+
+
+@pytest.fixture
+def meta_dir(tmp_path):
+    meta = tmp_path / "commit_msg"
+    (meta / "r").mkdir(parents=True)
+    (meta / "r" / "status.txt").write_text("full")
+    return meta
+
+
+class TestReadAll:
+    def test_fallback_for_missing_file(self, meta_dir):
+        reader = GitMetaReader(meta_dir)
+        files = reader.read_all(
+            "r", ("status_fast.txt",), {"status_fast.txt": "status.txt"}
+        )
+        assert files == {"status_fast.txt": "full"}
+
+    def test_prefers_file_over_fallback(self, meta_dir):
+        (meta_dir / "r" / "status_fast.txt").write_text("fast")
+        reader = GitMetaReader(meta_dir)
+        files = reader.read_all(
+            "r", ("status_fast.txt",), {"status_fast.txt": "status.txt"}
+        )
+        assert files == {"status_fast.txt": "fast"}
+
+    def test_missing_without_fallback_raises(self, meta_dir):
+        with pytest.raises(FileNotFoundError, match="Metadata file not found"):
+            GitMetaReader(meta_dir).read_all("r", ("branch.txt",))
+
+    def test_read_file_decodes_like_read_all(self, meta_dir):
+        # Both fill one cache, so the content can't depend on which ran first.
+        (meta_dir / "r" / "diff.txt").write_bytes("a\r\nb é\n".encode())
+        first_file = GitMetaReader(meta_dir)
+        first_all = GitMetaReader(meta_dir)
+        text = first_file.read_file("r", "diff.txt")
+        assert text == first_all.read_all("r", ("diff.txt",))["diff.txt"]
+        assert text == "a\r\nb é\n"
+        assert first_file.read_all("r", ("diff.txt",))["diff.txt"] == text
+
+    def test_read_file_missing_raises(self, meta_dir):
+        with pytest.raises(FileNotFoundError, match="Metadata file not found"):
+            GitMetaReader(meta_dir).read_file("r", "branch.txt")
+
+
+class TestDetectRepoFromCwd:
+    @pytest.fixture
+    def root(self, tmp_path):
+        """sync_root with repo "r" (and its metadata) plus an unknown dir."""
+        root = tmp_path / "sync"
+        (root / "commit_msg" / "r").mkdir(parents=True)
+        (root / "r" / "a" / "b").mkdir(parents=True)
+        (root / "unknown").mkdir()
+        return root
+
+    def _detect(self, monkeypatch, cwd, meta_dir):
+        monkeypatch.chdir(cwd)
+        return detect_repo_from_cwd(meta_dir)
+
+    def test_cwd_is_sync_root(self, root, monkeypatch):
+        assert self._detect(monkeypatch, root, root / "commit_msg") is None
+
+    def test_repo_and_nested_subdir(self, root, monkeypatch):
+        meta = root / "commit_msg"
+        assert self._detect(monkeypatch, root / "r", meta) == "r"
+        assert self._detect(monkeypatch, root / "r" / "a" / "b", meta) == "r"
+
+    def test_dir_without_metadata(self, root, monkeypatch):
+        assert self._detect(monkeypatch, root / "unknown", root / "commit_msg") is None
+
+    def test_outside_root(self, root, tmp_path, monkeypatch):
+        (tmp_path / "elsewhere").mkdir()
+        meta = root / "commit_msg"
+        assert self._detect(monkeypatch, tmp_path / "elsewhere", meta) is None
+
+    def test_symlinked_cwd(self, root, tmp_path, monkeypatch):
+        link = tmp_path / "link"
+        link.symlink_to(root / "r" / "a")
+        assert self._detect(monkeypatch, link, root / "commit_msg") == "r"
+        # A logical cwd (like $PWD) that still goes through the link only
+        # matches via the resolved retry.
+        monkeypatch.setattr(Path, "cwd", classmethod(lambda cls: link))
+        assert detect_repo_from_cwd(root / "commit_msg") == "r"
+
+    def test_sync_root_through_symlink(self, root, tmp_path, monkeypatch):
+        # SYNC_ROOT configured as a symlink; getcwd() reports the real path.
+        link_root = tmp_path / "sync_link"
+        link_root.symlink_to(root)
+        meta = link_root / "commit_msg"
+        assert self._detect(monkeypatch, root / "r" / "a", meta) == "r"
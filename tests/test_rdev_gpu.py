@@ -0,0 +1,66 @@
+"""Tests for rdev's GPU probe: parsing the remote script's G/P/D/N rows."""
+
+import subprocess
+
+import pytest
+
+from my_toolbox.rdev import container
+from my_toolbox.rdev.container import GpuProc, fetch_gpu_info
+
+CID_A = "a" * 64
+CID_B = "b" * 64
+
+_OUTPUT = f"""\
+G|0, GPU-aaa, 10, 100, 81920
+G|1, GPU-bbb, [N/A], [N/A], 81920
+P|123, GPU-aaa, 2048
+P|456, GPU-bbb, [N/A]
+P|789, GPU-bbb, 512
+P|999, GPU-ccc, 1
+D|123|{CID_A}
+D|456|{CID_B}
+N|{CID_A}|/ctr_a
+"""
+
+
+def _fake_ssh(stdout: str, rc: int = 0):
+    def run(host, cmd, **kwargs):
+        return subprocess.CompletedProcess(["ssh"], rc, stdout.encode(), b"")
+
+    return run
+
+
+@pytest.fixture
+def gpus(monkeypatch):
+    monkeypatch.setattr(container, "_ssh_run", _fake_ssh(_OUTPUT))
+    return fetch_gpu_info("host")
+
+
+def test_gpu_rows(gpus):
+    assert [(g.index, g.util_pct, g.mem_used_mb) for g in gpus] == [
+        (0, 10, 100),
+        # [N/A] util / memory counts as 0 instead of dropping the GPU.
+        (1, 0, 0),
+    ]
+
+
+def test_pid_in_named_container(gpus):
+    assert gpus[0].procs == [GpuProc(container="ctr_a", mem_mb=2048)]
+
+
+def test_unnamed_container_and_no_container(gpus):
+    assert gpus[1].procs == [
+        # D row but no N row: short container ID, [N/A] memory as 0.
+        GpuProc(container=CID_B[:12], mem_mb=0),
+        # No D row: not in a container.
+        GpuProc(container="-", mem_mb=512),
+    ]
+
+
+def test_unknown_gpu_uuid_dropped(gpus):
+    assert sum(len(g.procs) for g in gpus) == 3
+
+
+def test_ssh_failure(monkeypatch):
+    monkeypatch.setattr(container, "_ssh_run", _fake_ssh("", rc=255))
+    assert fetch_gpu_info("host") is None
@@ -0,0 +1,113 @@
+"""Tests for rgit parsing helpers: git status sections and config snapshot."""
+
+import subprocess
+
+from my_toolbox.git.rgit import (
+    _git_config_effective,
+    _git_toplevel_and_config,
+    _parse_config_list,
+    _parse_status_lines,
+    _strip_ansi,
+)
+
+# `git -c color.status=always status` output (default colors: entries only).
+_STATUS = (
+    "On branch master\n"
+    "Changes to be committed:\n"
+    '  (use "git restore --staged <file>..." to unstage)\n'
+    "\t\x1b[32mnew file:   g\x1b[m\n"
+    "\n"
+    "Changes not staged for commit:\n"
+    '  (use "git add <file>..." to update what will be committed)\n'
+    "\t\x1b[31mmodified:   f\x1b[m\n"
+    "\n"
+    "Untracked files:\n"
+    '  (use "git add <file>..." to include in what will be committed)\n'
+    "\t\x1b[31mh\x1b[m\n"
+)
+
+# Same with color.status.header=yellow: every line, headers included, is
+# wrapped in escapes, and entries' leading tab sits inside them.
+_STATUS_HEADER_COLOR = (
+    "\x1b[33m\x1b[m\x1b[33mOn branch \x1b[m\x1b[33mmaster\x1b[m\n"
+    "\x1b[33mChanges to be committed:\x1b[m\n"
+    '\x1b[33m  (use "git restore --staged <file>..." to unstage)\x1b[m\n'
+    "\x1b[33m\t\x1b[m\x1b[32mnew file:   g\x1b[m\n"
+    "\x1b[33m\x1b[m\n"
+    "\x1b[33mChanges not staged for commit:\x1b[m\n"
+    "\x1b[33m\t\x1b[m\x1b[31mmodified:   f\x1b[m\n"
+    "\x1b[33m\x1b[m\n"
+    "\x1b[33mUntracked files:\x1b[m\n"
+    "\x1b[33m\t\x1b[m\x1b[31mh\x1b[m\n"
+)
+
+
+class TestParseStatusLines:
+    def _plain(self, parsed):
+        return {k: [_strip_ansi(v).strip() for v in vs] for k, vs in parsed.items()}
+
+    def test_default_colors(self):
+        assert self._plain(_parse_status_lines(_STATUS)) == {
+            "staged": ["new file:   g"],
+            "unstaged": ["modified:   f"],
+            "untracked": ["h"],
+        }
+
+    def test_colored_headers(self):
+        parsed = _parse_status_lines(_STATUS_HEADER_COLOR)
+        assert self._plain(parsed) == self._plain(_parse_status_lines(_STATUS))
+        # Original colored lines are kept for display.
+        assert parsed["staged"][0].startswith("\x1b[33m\t")
+
+    def test_clean(self):
+        clean = "On branch master\nnothing to commit, working tree clean\n"
+        assert not any(_parse_status_lines(clean).values())
+
+
+# `git config --list --show-scope -z`: NUL-separated scope / "key\nvalue"
+# fields; a valueless key (`[x] flag`) has no "\n" at all.
+_CONFIG = (
+    "global\0user.name\nGlobal Name\0"
+    "local\0a.multi\nline1\nline2\0"
+    "local\0x.flag\0"
+    "local\0user.name\nLocal Name\0"
+    "command\0user.name\ncmdline\0"
+)
+
+
+class TestParseConfigList:
+    def test_scopes_and_values(self):
+        snap = _parse_config_list(_CONFIG)
+        assert list(snap) == ["global", "local", "command"]
+        assert snap["local"]["a.multi"] == "line1\nline2"
+        assert snap["local"]["x.flag"] == ""
+
+    def test_same_key_several_scopes(self):
+        snap = _parse_config_list(_CONFIG)
+        assert snap["global"]["user.name"] == "Global Name"
+        assert snap["local"]["user.name"] == "Local Name"
+        assert _git_config_effective(snap, "user.name") == "cmdline"
+        assert _git_config_effective(snap, "no.such") is None
+
+    def test_empty(self):
+        assert _parse_config_list("") == {}
+
+
+class TestGitToplevelAndConfig:
+    def test_inside_repo(self, tmp_path, monkeypatch):
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        subprocess.run(
+            ["git", "-C", str(tmp_path), "config", "a.multi", "l1\nl2"], check=True
+        )
+        (tmp_path / "sub").mkdir()
+        monkeypatch.chdir(tmp_path / "sub")
+        toplevel, snap = _git_toplevel_and_config()
+        assert toplevel == str(tmp_path.resolve())
+        assert snap["local"]["a.multi"] == "l1\nl2"
+
+    def test_outside_repo(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+        monkeypatch.chdir(tmp_path)
+        toplevel, snap = _git_toplevel_and_config()
+        assert toplevel is None
+        assert "local" not in snap
@@ -0,0 +1,21 @@
+"""Tests for sgl-run argument parsing (server vs router mode)."""
+
+import pytest
+
+from my_toolbox.sgl_run.launch import parse_args
+
+
+def test_router_mode_gets_router_options():
+    args = parse_args(["--router", "--port-prefill", "1"])
+    assert args.router and args.port_prefill == 1
+
+
+def test_server_mode():
+    args = parse_args(["--prefill"])
+    assert args.prefill and not args.router
+
+
+def test_router_prefix_is_not_abbreviated():
+    # "--rout" must not sneak into router mode without the router options.
+    with pytest.raises(SystemExit):
+        parse_args(["--rout"])
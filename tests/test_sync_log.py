@@ -0,0 +1,58 @@
+"""Tests for rdev sync log: tail read of the last record."""
+
+import pytest
+
+from my_toolbox.rdev._sync import sync_log
+from my_toolbox.rdev._sync.sync_log import Logger
+
+
+@pytest.fixture
+def logger(tmp_path, monkeypatch):
+    monkeypatch.setattr(sync_log, "RDEV_SYNC_LOG", tmp_path / "sync.log")
+    return Logger()
+
+
+def _write(logger: Logger, data: bytes) -> None:
+    logger.log_file.write_bytes(data)
+
+
+class TestReadLastLine:
+    def test_empty_file(self, logger):
+        assert logger._read_last_line() is None
+
+    def test_blank_only(self, logger):
+        _write(logger, b"\n  \n\n")
+        assert logger._read_last_line() is None
+
+    def test_no_trailing_newline(self, logger):
+        _write(logger, b"first\nsecond")
+        assert logger._read_last_line() == b"second"
+
+    def test_trailing_blank_lines(self, logger):
+        _write(logger, b"first\nsecond\n\n   \n")
+        assert logger._read_last_line() == b"second"
+
+    def test_last_line_longer_than_window(self, logger):
+        # The first 4 KiB block holds only a partial line, so the window has
+        # to double (twice) before the whole last line is in view.
+        long = b"x" * 10_000
+        _write(logger, b"first\n" + long + b"\n")
+        assert logger._read_last_line() == long
+
+    def test_single_long_line_reaches_bof(self, logger):
+        long = b"y" * 9_000
+        _write(logger, long)
+        assert logger._read_last_line() == long
+
+
+def test_log_one_round_trip(logger):
+    assert logger.read_last_sync_log() is None
+    logger.log_one("a/b", ["h1", "h2"], delete=False, git_repo=True)
+    logger.log_one("c", "h3", delete=True, git_repo=False)
+    last = logger.read_last_sync_log()
+    assert (last.path, last.hosts, last.delete, last.git_repo) == (
+        "c",
+        "h3",
+        True,
+        False,
+    )
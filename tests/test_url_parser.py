@@ -0,0 +1,27 @@
+"""Tests for GitHub URL parsing (rgh cancel / checkout input)."""
+
+from my_toolbox.gh.url_parser import parse_github_url
+
+
+class TestParseGithubUrl:
+    def test_actions_run(self):
+        gh = parse_github_url("https://github.com/o/r/actions/runs/123")
+        assert (gh.type, gh.repo_full, gh.number) == ("run", "o/r", "123")
+        assert gh.job_id is None
+
+    def test_actions_run_with_job(self):
+        gh = parse_github_url("https://github.com/o/r/actions/runs/123/job/456")
+        assert (gh.type, gh.number, gh.job_id) == ("run", "123", "456")
+
+    def test_pr_with_trailing_segment(self):
+        # Trailing path (e.g. the "Files changed" tab) must still parse.
+        gh = parse_github_url("https://github.com/o/r/pull/42/files")
+        assert (gh.type, gh.repo_full, gh.number) == ("pr", "o/r", "42")
+
+    def test_issue(self):
+        gh = parse_github_url("https://github.com/o/r/issues/7")
+        assert (gh.type, gh.number) == ("issue", "7")
+
+    def test_unrecognized(self):
+        assert parse_github_url("https://github.com/o/r/tree/main") is None
+        assert parse_github_url("https://github.com/o/r") is None